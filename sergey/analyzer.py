@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import ast
+import contextlib
+import functools
 import re
 from typing import TYPE_CHECKING, Final
 
+from sergey.rules.analysis import Analysis
+
 if TYPE_CHECKING:
     from sergey.rules import base
 
@@ -24,6 +28,17 @@ _FILE_DISABLE_PAT: Final = re.compile(
 )
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_cached(source: str) -> ast.Module:
+    """Parse source, memoizing the tree by exact source text.
+
+    Editors re-send unchanged documents and test suites analyze identical
+    snippets repeatedly; reusing the parsed tree skips the CPython parser on
+    those hits. Sharing trees is safe because rules only read the AST.
+    """
+    return ast.parse(source)
+
+
 def _rule_ids(raw: str | None) -> frozenset[str] | None:
     """Parse rule IDs from a suppression comment capture group.
 
@@ -88,6 +103,11 @@ class Analyzer:
             rules: Rule instances to run on every analysis request.
         """
         self.rules = rules
+        # Memo of the most recent (source, diagnostics) pair. Memoizing by
+        # subtree identity would be unsound (ids are reused once nodes are
+        # collected), but whole-source equality is exact and covers the
+        # common case of consecutive identical analyses.
+        self._last: tuple[str, list[base.Diagnostic]] | None = None
 
     def analyze(self, source: str) -> list[base.Diagnostic]:
         """Parse source, run all rules, and apply inline suppressions.
@@ -99,13 +119,23 @@ class Analyzer:
             Diagnostics sorted by (line, col) with suppressed entries removed.
             Returns an empty list if the source cannot be parsed.
         """
+        last = self._last
+        if last is not None and last[0] == source:
+            return list(last[1])
+
         try:
-            tree = ast.parse(source)
+            tree = _parse_cached(source)
         except SyntaxError:
             return []
 
-        diagnostics = sorted(
-            [diag for rule in self.rules for diag in rule.check(tree, source)],
-            key=lambda diag: (diag.line, diag.col),
-        )
-        return _apply_suppressions(diagnostics, source)
+        analysis = Analysis(tree)
+        diagnostics: list[base.Diagnostic] = []
+        for rule in self.rules:
+            # One guard at the orchestration boundary: a buggy rule must not
+            # poison the whole run, and rules stay free of per-call handlers.
+            with contextlib.suppress(Exception):
+                diagnostics.extend(rule.check_analysis(analysis, source))
+        diagnostics.sort(key=lambda diag: (diag.line, diag.col))
+        result = _apply_suppressions(diagnostics, source)
+        self._last = (source, result)
+        return list(result)
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import pathlib
 import tomllib
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -13,7 +14,7 @@ if TYPE_CHECKING:
     from sergey.rules import base
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Config:
     """Resolved sergey configuration.
 
@@ -39,6 +40,25 @@ def _find_pyproject(start: pathlib.Path) -> pathlib.Path | None:
     return None
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_pyproject(
+    path_str: str,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+) -> dict[str, Any]:
+    """Read and parse a pyproject.toml, memoized by path and file identity.
+
+    ``mtime_ns`` and ``size`` exist only as cache-key components: a changed
+    file produces a new key and re-parses, so the body never reads them.
+
+    Editors trigger a config lookup per analysis request; keying the cache on
+    mtime and size means an unchanged file skips both the read and the TOML
+    parse, while any edit changes the key and re-parses naturally.
+    """
+    with pathlib.Path(path_str).open("rb") as fh:
+        return tomllib.load(fh)
+
+
 def load_config(start: pathlib.Path | None = None) -> Config:
     """Return the Config from the nearest pyproject.toml, or defaults.
 
@@ -59,8 +79,8 @@ def load_config(start: pathlib.Path | None = None) -> Config:
         return Config(select=None, ignore=frozenset())
 
     try:
-        with pyproject.open("rb") as fh:
-            data = tomllib.load(fh)
+        stat = pyproject.stat()
+        data = _parse_pyproject(str(pyproject), stat.st_mtime_ns, stat.st_size)
     except (OSError, tomllib.TOMLDecodeError):
         return Config(select=None, ignore=frozenset())
 
@@ -106,7 +126,7 @@ def configure_rules(
     """
     result: list[base.Rule] = []
     for rule in active_rules:
-        opts = config.rule_options.get(type(rule).__name__, {})
+        opts = config.rule_options.get(rule.id, {})
         result.append(rule.configure(opts) if opts else rule)
     return result
 
@@ -128,9 +148,11 @@ def filter_rules(
     Returns:
         Filtered list preserving the original order.
     """
+    if config.select is None and not config.ignore:
+        return list(all_rules)
     active: list[base.Rule] = list(all_rules)
     if config.select is not None:
-        active = [rule for rule in active if type(rule).__name__ in config.select]
+        active = [rule for rule in active if rule.id in config.select]
     if config.ignore:
-        active = [rule for rule in active if type(rule).__name__ not in config.ignore]
+        active = [rule for rule in active if rule.id not in config.ignore]
     return active
@@ -0,0 +1,62 @@
+"""Shared per-file analysis indices consumed by rules."""
+
+from __future__ import annotations
+
+import ast
+import functools
+from typing import cast
+
+
+class Analysis:
+    """Lazily computed node indices over a parsed module.
+
+    One instance is built per analyzed file and handed to every rule, so the
+    full tree walk needed to index nodes happens at most once per file no
+    matter how many rules consume it. Each index is a cached property:
+    analyses that never touch an index pay nothing for it.
+    """
+
+    def __init__(self, tree: ast.Module) -> None:
+        """Initialize with the parsed tree to index.
+
+        Args:
+            tree: The parsed AST of the source file.
+        """
+        self.tree = tree
+
+    @functools.cached_property
+    def by_type(self) -> dict[type[ast.AST], list[ast.AST]]:
+        """Map each node type to its instances, in tree-walk order."""
+        index: dict[type[ast.AST], list[ast.AST]] = {}
+        for node in ast.walk(self.tree):
+            index.setdefault(type(node), []).append(node)
+        return index
+
+    @functools.cached_property
+    def functions(self) -> list[ast.FunctionDef | ast.AsyncFunctionDef]:
+        """All function definitions, sync then async."""
+        # by_type maps each key to instances of exactly that type; cast()
+        # records that invariant at the index boundary for the type checker.
+        by_type = self.by_type
+        return [
+            *cast("list[ast.FunctionDef]", by_type.get(ast.FunctionDef, [])),
+            *cast(
+                "list[ast.AsyncFunctionDef]",
+                by_type.get(ast.AsyncFunctionDef, []),
+            ),
+        ]
+
+    @functools.cached_property
+    def tries(self) -> list[ast.Try]:
+        """All ``try`` statements."""
+        return cast("list[ast.Try]", self.by_type.get(ast.Try, []))
+
+    @functools.cached_property
+    def imports(self) -> list[ast.Import]:
+        """All plain ``import`` statements."""
+        return cast("list[ast.Import]", self.by_type.get(ast.Import, []))
+
+    @functools.cached_property
+    def classes(self) -> list[ast.ClassDef]:
+        """All class definitions."""
+        return cast("list[ast.ClassDef]", self.by_type.get(ast.ClassDef, []))
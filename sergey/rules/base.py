@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import ast
 
+    from sergey.rules.analysis import Analysis
+
 
 class Severity(enum.Enum):
     """LSP diagnostic severity levels."""
@@ -51,9 +53,15 @@ class Fix:
     additional_edits: list[TextEdit] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class Diagnostic:
-    """A single diagnostic emitted by a rule."""
+    """A single diagnostic emitted by a rule.
+
+    Slotted because analyses of large files construct one instance per
+    violation; slots keep the per-instance footprint small. Frozen because
+    diagnostics are passed between the analyzer, suppression filtering, and
+    the LSP/CLI front ends — no consumer may rewrite one in place.
+    """
 
     rule_id: str
     message: str
@@ -68,6 +76,19 @@ class Diagnostic:
 class Rule(abc.ABC):
     """Abstract base class for all sergey rules."""
 
+    id: str
+    """The rule ID, which is always the class name (e.g. ``PDT001``)."""
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Bind the rule ID once at class creation.
+
+        Class names are interned identifiers, so ``rule.id`` membership tests
+        against frozensets of IDs compare by pointer on the hit path instead
+        of re-reading ``type(rule).__name__`` per call.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.id = cls.__name__
+
     @abc.abstractmethod
     def check(self, tree: ast.Module, source: str) -> list[Diagnostic]:
         """Analyze the AST and return any diagnostics.
@@ -81,6 +102,22 @@ class Rule(abc.ABC):
             are found or if an internal error occurs.
         """
 
+    def check_analysis(self, analysis: Analysis, source: str) -> list[Diagnostic]:
+        """Analyze a file through a shared Analysis and return diagnostics.
+
+        The default implementation delegates to :meth:`check` on the wrapped
+        tree. Rules that only need nodes of specific types should override
+        this and read the precomputed indices instead of walking the tree.
+
+        Args:
+            analysis: Shared per-file indices over the parsed tree.
+            source: The raw source string.
+
+        Returns:
+            A list of Diagnostic instances.
+        """
+        return self.check(analysis.tree, source)
+
     def configure(self, options: dict[str, int | str | bool]) -> Rule:
         """Return a new Rule with the given options applied.
 
@@ -4,6 +4,7 @@ import ast
 import re
 from typing import Final
 
+from sergey.rules import analysis as analysis_mod
 from sergey.rules import base
 
 # Scope boundaries: raises inside these nodes belong to a different function.
@@ -116,6 +117,8 @@ def _check_doc(
         return []
     raises_content = _raises_section_content(docstring)
     if raises_content is None:
+        lineno = func.lineno
+        col_offset = func.col_offset
         return [
             base.Diagnostic(
                 rule_id="DOC001",
@@ -123,10 +126,10 @@ def _check_doc(
                     f"Function `{func.name}` raises exceptions but its"
                     f" docstring has no `Raises` section"
                 ),
-                line=func.lineno,
-                col=func.col_offset,
-                end_line=func.end_lineno or func.lineno,
-                end_col=func.end_col_offset or func.col_offset,
+                line=lineno,
+                col=col_offset,
+                end_line=func.end_lineno or lineno,
+                end_col=func.end_col_offset or col_offset,
                 severity=base.Severity.WARNING,
             )
         ]
@@ -141,6 +144,8 @@ def _check_doc(
         seen.add(name)
         if re.search(r"\b" + re.escape(name) + r"\b", raises_content):
             continue
+        lineno = raise_node.lineno
+        col_offset = raise_node.col_offset
         diagnostics.append(
             base.Diagnostic(
                 rule_id="DOC001",
@@ -148,10 +153,10 @@ def _check_doc(
                     f"Function `{func.name}` raises `{name}` but the"
                     f" `Raises` section does not document it"
                 ),
-                line=raise_node.lineno,
-                col=raise_node.col_offset,
-                end_line=raise_node.end_lineno or raise_node.lineno,
-                end_col=raise_node.end_col_offset or raise_node.col_offset,
+                line=lineno,
+                col=col_offset,
+                end_line=raise_node.end_lineno or lineno,
+                end_col=raise_node.end_col_offset or col_offset,
                 severity=base.Severity.WARNING,
             )
         )
@@ -199,3 +204,17 @@ class DOC001(base.Rule):
         except Exception:  # noqa: BLE001, S110
             pass
         return diagnostics
+
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed function definition, skipping the tree walk."""
+        diagnostics: list[base.Diagnostic] = []
+        try:
+            for func in analysis.functions:
+                diagnostics.extend(_check_doc(func))
+        except Exception:  # noqa: BLE001, S110
+            pass
+        return diagnostics
@@ -1,9 +1,11 @@
 """Import-style rules: IMP002, IMP003, IMP004, and IMP005."""
 
 import ast
+import functools
 from importlib import util as importlib_util
-from typing import Final
+from typing import Final, cast
 
+from sergey.rules import analysis as analysis_mod
 from sergey.rules import base
 
 # Typing modules covered by IMP002.
@@ -15,6 +17,72 @@ _IMP003_EXCLUDED: Final[frozenset[str]] = frozenset({"collections.abc"})
 # Collections modules covered by IMP004.
 _COLLECTIONS_MODULES: Final[frozenset[str]] = frozenset({"collections.abc"})
 
+# ast.TryStar (try/except*) was added in Python 3.11.
+_TRY_TYPES: Final[frozenset[type[ast.AST]]] = frozenset(
+    {ast.Try, ast.TryStar} if hasattr(ast, "TryStar") else {ast.Try}
+)
+
+# Statement-bearing fields per compound statement type. Import statements can
+# only live inside these bodies, so the scan never descends into expressions
+# and stays proportional to the statement count rather than the node count.
+_STMT_FIELDS: Final[dict[type[ast.AST], tuple[str, ...]]] = {
+    ast.FunctionDef: ("body",),
+    ast.AsyncFunctionDef: ("body",),
+    ast.ClassDef: ("body",),
+    ast.If: ("body", "orelse"),
+    ast.For: ("body", "orelse"),
+    ast.AsyncFor: ("body", "orelse"),
+    ast.While: ("body", "orelse"),
+    ast.With: ("body",),
+    ast.AsyncWith: ("body",),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _from_import_message(module: str) -> str:
+    """Return the IMP002/IMP004 message for a module, cached per module name.
+
+    The handful of module names these rules flag repeat across files, so
+    the formatted string is built once per distinct name.
+    """
+    return f"Use `from {module} import ...` instead of `import {module}`"
+
+
+@functools.lru_cache(maxsize=256)
+def _imp003_message(module: str) -> str:
+    """Return the IMP003 message for a dotted module name, cached."""
+    parent, _, name = module.rpartition(".")
+    return f"Use `from {parent} import {name}` instead of `import {module}`"
+
+
+def _find_imports(tree: ast.Module) -> list[ast.Import]:
+    """Return all plain import statements, descending only into statement fields."""
+    found: list[ast.Import] = []
+    stack: list[ast.stmt] = list(tree.body)
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is ast.Import:
+            # Membership on type(node) does not narrow for the type checker,
+            # so cast before the typed append; ast.Try also covers TryStar.
+            found.append(cast("ast.Import", node))
+        elif node_type in _TRY_TYPES:
+            try_node = cast("ast.Try", node)
+            stack.extend(try_node.body)
+            stack.extend(try_node.orelse)
+            stack.extend(try_node.finalbody)
+            for handler in try_node.handlers:
+                stack.extend(handler.body)
+        elif node_type is ast.Match:
+            for case in cast("ast.Match", node).cases:
+                stack.extend(case.body)
+        else:
+            fields = _STMT_FIELDS.get(node_type)
+            if fields is not None:
+                for field in fields:
+                    stack.extend(getattr(node, field))
+    return found
+
 
 def _collect_simple_attr_refs(
     local_name: str,
@@ -271,30 +339,46 @@ class IMP002(base.Rule):
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Return a diagnostic for every plain import of a typing module."""
         diagnostics: list[base.Diagnostic] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Import):
-                continue
-            if not any(alias.name in _TYPING_MODULES for alias in node.names):
+        for node in _find_imports(tree):
+            diagnostics.extend(self._check_import(node, tree))
+        return diagnostics
+
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed import statement, skipping the tree scan."""
+        diagnostics: list[base.Diagnostic] = []
+        for node in analysis.imports:
+            diagnostics.extend(self._check_import(node, analysis.tree))
+        return diagnostics
+
+    def _check_import(
+        self,
+        node: ast.Import,
+        tree: ast.Module,
+    ) -> list[base.Diagnostic]:
+        """Return IMP002 diagnostics for a single import statement."""
+        if not any(alias.name in _TYPING_MODULES for alias in node.names):
+            return []
+        fix = _imp002_fix(node, tree)
+        diagnostics: list[base.Diagnostic] = []
+        for alias in node.names:
+            if alias.name not in _TYPING_MODULES:
                 continue
-            fix = _imp002_fix(node, tree)
-            for alias in node.names:
-                if alias.name not in _TYPING_MODULES:
-                    continue
-                diagnostics.append(
-                    base.Diagnostic(
-                        rule_id="IMP002",
-                        message=(
-                            f"Use `from {alias.name} import ...`"
-                            f" instead of `import {alias.name}`"
-                        ),
-                        line=node.lineno,
-                        col=node.col_offset,
-                        end_line=node.end_lineno or node.lineno,
-                        end_col=node.end_col_offset or node.col_offset,
-                        severity=base.Severity.WARNING,
-                        fix=fix,
-                    )
+            diagnostics.append(
+                base.Diagnostic(
+                    rule_id="IMP002",
+                    message=_from_import_message(alias.name),
+                    line=node.lineno,
+                    col=node.col_offset,
+                    end_line=node.end_lineno or node.lineno,
+                    end_col=node.end_col_offset or node.col_offset,
+                    severity=base.Severity.WARNING,
+                    fix=fix,
                 )
+            )
         return diagnostics
 
 
@@ -314,30 +398,41 @@ class IMP003(base.Rule):
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Return a diagnostic for every dotted plain import."""
         diagnostics: list[base.Diagnostic] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Import):
+        for node in _find_imports(tree):
+            diagnostics.extend(self._check_import(node))
+        return diagnostics
+
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed import statement, skipping the tree scan."""
+        diagnostics: list[base.Diagnostic] = []
+        for node in analysis.imports:
+            diagnostics.extend(self._check_import(node))
+        return diagnostics
+
+    def _check_import(self, node: ast.Import) -> list[base.Diagnostic]:
+        """Return IMP003 diagnostics for a single import statement."""
+        diagnostics: list[base.Diagnostic] = []
+        for alias in node.names:
+            if "." not in alias.name:
                 continue
-            for alias in node.names:
-                if "." not in alias.name:
-                    continue
-                if alias.name in _IMP003_EXCLUDED:
-                    continue
-                parent, _, name = alias.name.rpartition(".")
-                diagnostics.append(
-                    base.Diagnostic(
-                        rule_id="IMP003",
-                        message=(
-                            f"Use `from {parent} import {name}`"
-                            f" instead of `import {alias.name}`"
-                        ),
-                        line=node.lineno,
-                        col=node.col_offset,
-                        end_line=node.end_lineno or node.lineno,
-                        end_col=node.end_col_offset or node.col_offset,
-                        severity=base.Severity.WARNING,
-                        fix=_imp003_fix(node),
-                    )
+            if alias.name in _IMP003_EXCLUDED:
+                continue
+            diagnostics.append(
+                base.Diagnostic(
+                    rule_id="IMP003",
+                    message=_imp003_message(alias.name),
+                    line=node.lineno,
+                    col=node.col_offset,
+                    end_line=node.end_lineno or node.lineno,
+                    end_col=node.end_col_offset or node.col_offset,
+                    severity=base.Severity.WARNING,
+                    fix=_imp003_fix(node),
                 )
+            )
         return diagnostics
 
 
@@ -355,30 +450,46 @@ class IMP004(base.Rule):
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Return a diagnostic for every plain import of a collections module."""
         diagnostics: list[base.Diagnostic] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Import):
-                continue
-            if not any(alias.name in _COLLECTIONS_MODULES for alias in node.names):
+        for node in _find_imports(tree):
+            diagnostics.extend(self._check_import(node, tree))
+        return diagnostics
+
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed import statement, skipping the tree scan."""
+        diagnostics: list[base.Diagnostic] = []
+        for node in analysis.imports:
+            diagnostics.extend(self._check_import(node, analysis.tree))
+        return diagnostics
+
+    def _check_import(
+        self,
+        node: ast.Import,
+        tree: ast.Module,
+    ) -> list[base.Diagnostic]:
+        """Return IMP004 diagnostics for a single import statement."""
+        if not any(alias.name in _COLLECTIONS_MODULES for alias in node.names):
+            return []
+        fix = _imp004_fix(node, tree)
+        diagnostics: list[base.Diagnostic] = []
+        for alias in node.names:
+            if alias.name not in _COLLECTIONS_MODULES:
                 continue
-            fix = _imp004_fix(node, tree)
-            for alias in node.names:
-                if alias.name not in _COLLECTIONS_MODULES:
-                    continue
-                diagnostics.append(
-                    base.Diagnostic(
-                        rule_id="IMP004",
-                        message=(
-                            f"Use `from {alias.name} import ...`"
-                            f" instead of `import {alias.name}`"
-                        ),
-                        line=node.lineno,
-                        col=node.col_offset,
-                        end_line=node.end_lineno or node.lineno,
-                        end_col=node.end_col_offset or node.col_offset,
-                        severity=base.Severity.WARNING,
-                        fix=fix,
-                    )
+            diagnostics.append(
+                base.Diagnostic(
+                    rule_id="IMP004",
+                    message=_from_import_message(alias.name),
+                    line=node.lineno,
+                    col=node.col_offset,
+                    end_line=node.end_lineno or node.lineno,
+                    end_col=node.end_col_offset or node.col_offset,
+                    severity=base.Severity.WARNING,
+                    fix=fix,
                 )
+            )
         return diagnostics
 
 
@@ -487,42 +598,59 @@ class IMP005(base.Rule):
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Return a diagnostic for every plain import used via submodule access."""
         diagnostics: list[base.Diagnostic] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Import):
-                continue
+        for node in _find_imports(tree):
+            diagnostics.extend(self._check_import(node, tree))
+        return diagnostics
 
-            violating: dict[ast.alias, frozenset[str]] = {}
-            for alias in node.names:
-                # Skip dotted imports — IMP003 already handles those.
-                if "." in alias.name:
-                    continue
-                local_name = alias.asname or alias.name
-                submodules = _imp005_submodule_attrs(local_name, alias.name, tree)
-                if submodules:
-                    violating[alias] = submodules
-
-            if not violating:
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed import statement, skipping the tree scan."""
+        diagnostics: list[base.Diagnostic] = []
+        for node in analysis.imports:
+            diagnostics.extend(self._check_import(node, analysis.tree))
+        return diagnostics
+
+    def _check_import(
+        self,
+        node: ast.Import,
+        tree: ast.Module,
+    ) -> list[base.Diagnostic]:
+        """Return IMP005 diagnostics for a single import statement."""
+        violating: dict[ast.alias, frozenset[str]] = {}
+        for alias in node.names:
+            # Skip dotted imports — IMP003 already handles those.
+            if "." in alias.name:
                 continue
+            local_name = alias.asname or alias.name
+            submodules = _imp005_submodule_attrs(local_name, alias.name, tree)
+            if submodules:
+                violating[alias] = submodules
 
-            fix = _imp005_fix(node, violating, tree)
-
-            for alias, submodule_names in violating.items():
-                names_str = ", ".join(sorted(submodule_names))
-                local_name = alias.asname or alias.name
-                diagnostics.append(
-                    base.Diagnostic(
-                        rule_id="IMP005",
-                        message=(
-                            f"Use `from {alias.name} import {names_str}`"
-                            f" instead of accessing submodule(s) via `{local_name}`"
-                        ),
-                        line=node.lineno,
-                        col=node.col_offset,
-                        end_line=node.end_lineno or node.lineno,
-                        end_col=node.end_col_offset or node.col_offset,
-                        severity=base.Severity.WARNING,
-                        fix=fix,
-                    )
-                )
+        if not violating:
+            return []
 
+        fix = _imp005_fix(node, violating, tree)
+
+        diagnostics: list[base.Diagnostic] = []
+        for alias, submodule_names in violating.items():
+            names_str = ", ".join(sorted(submodule_names))
+            local_name = alias.asname or alias.name
+            diagnostics.append(
+                base.Diagnostic(
+                    rule_id="IMP005",
+                    message=(
+                        f"Use `from {alias.name} import {names_str}`"
+                        f" instead of accessing submodule(s) via `{local_name}`"
+                    ),
+                    line=node.lineno,
+                    col=node.col_offset,
+                    end_line=node.end_lineno or node.lineno,
+                    end_col=node.end_col_offset or node.col_offset,
+                    severity=base.Severity.WARNING,
+                    fix=fix,
+                )
+            )
         return diagnostics
@@ -1,13 +1,49 @@
 """Naming rules: NAM001, NAM002, NAM003."""
 
 import ast
-from typing import Final
+from typing import Final, cast
 
+from sergey.rules import analysis as analysis_mod
 from sergey.rules import base
 
-_PREDICATE_PREFIXES: Final[frozenset[str]] = frozenset(
-    {"is_", "has_", "can_", "should_", "will_", "did_", "was_"}
+_PREDICATE_PREFIXES: Final[tuple[str, ...]] = (
+    "is_",
+    "has_",
+    "can_",
+    "should_",
+    "will_",
+    "did_",
+    "was_",
 )
+_PREDICATE_PREFIX_LIST: Final[str] = ", ".join(sorted(_PREDICATE_PREFIXES))
+
+
+def _check_predicate_name(
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+) -> base.Diagnostic | None:
+    """Return a NAM001 diagnostic if a bool-returning function is misnamed."""
+    name = node.name
+    if name.startswith("__") and name.endswith("__"):
+        return None
+    if not isinstance(node.returns, ast.Name) or node.returns.id != "bool":
+        return None
+    # Strip leading underscores so private helpers like `_is_valid`
+    # are treated the same as their public equivalents.
+    public_name = name.lstrip("_")
+    if public_name.startswith(_PREDICATE_PREFIXES):
+        return None
+    return base.Diagnostic(
+        rule_id="NAM001",
+        message=(
+            f"Function `{name}` returns `bool` but its name does not"
+            f" start with a predicate prefix ({_PREDICATE_PREFIX_LIST})"
+        ),
+        line=node.lineno,
+        col=node.col_offset,
+        end_line=node.end_lineno or node.lineno,
+        end_col=node.end_col_offset or node.col_offset,
+        severity=base.Severity.WARNING,
+    )
 
 
 class NAM001(base.Rule):
@@ -30,36 +66,52 @@ class NAM001(base.Rule):
 
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Flag bool-returning functions whose names lack a predicate prefix."""
-        diagnostics: list[base.Diagnostic] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                continue
-            name = node.name
-            if name.startswith("__") and name.endswith("__"):
-                continue
-            if not isinstance(node.returns, ast.Name) or node.returns.id != "bool":
-                continue
-            # Strip leading underscores so private helpers like `_is_valid`
-            # are treated the same as their public equivalents.
-            public_name = name.lstrip("_")
-            if any(public_name.startswith(prefix) for prefix in _PREDICATE_PREFIXES):
-                continue
-            prefixes = ", ".join(sorted(_PREDICATE_PREFIXES))
-            diagnostics.append(
-                base.Diagnostic(
-                    rule_id="NAM001",
-                    message=(
-                        f"Function `{name}` returns `bool` but its name does not"
-                        f" start with a predicate prefix ({prefixes})"
-                    ),
-                    line=node.lineno,
-                    col=node.col_offset,
-                    end_line=node.end_lineno or node.lineno,
-                    end_col=node.end_col_offset or node.col_offset,
-                    severity=base.Severity.WARNING,
-                )
-            )
-        return diagnostics
+        return [
+            diag
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and (diag := _check_predicate_name(node)) is not None
+        ]
+
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed function definition, skipping the tree walk."""
+        return [
+            diag
+            for func in analysis.functions
+            if (diag := _check_predicate_name(func)) is not None
+        ]
+
+
+def _is_single_char_name(name: str) -> bool:
+    """Return True for one-character names other than the throwaway `_`.
+
+    Shared by NAM002 (bindings) and NAM003 (parameters) so the two rules
+    cannot drift on what counts as non-descriptive.
+    """
+    return len(name) == 1 and name != "_"
+
+
+def _check_binding(node: ast.Name) -> base.Diagnostic | None:
+    """Return a NAM002 diagnostic if *node* is a single-character binding."""
+    if not isinstance(node.ctx, ast.Store):
+        return None
+    if not _is_single_char_name(node.id):
+        return None
+    return base.Diagnostic(
+        rule_id="NAM002",
+        message=(
+            f"Variable name `{node.id}` is not descriptive; use a meaningful name"
+        ),
+        line=node.lineno,
+        col=node.col_offset,
+        end_line=node.end_lineno or node.lineno,
+        end_col=node.end_col_offset or node.col_offset,
+        severity=base.Severity.WARNING,
+    )
 
 
 class NAM002(base.Rule):
@@ -82,29 +134,51 @@ class NAM002(base.Rule):
 
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Return a diagnostic for every single-character variable binding."""
-        diagnostics: list[base.Diagnostic] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Name):
-                continue
-            if not isinstance(node.ctx, ast.Store):
-                continue
-            if len(node.id) != 1 or node.id == "_":
-                continue
-            diagnostics.append(
-                base.Diagnostic(
-                    rule_id="NAM002",
-                    message=(
-                        f"Variable name `{node.id}` is not descriptive;"
-                        f" use a meaningful name"
-                    ),
-                    line=node.lineno,
-                    col=node.col_offset,
-                    end_line=node.end_lineno or node.lineno,
-                    end_col=node.end_col_offset or node.col_offset,
-                    severity=base.Severity.WARNING,
-                )
-            )
-        return diagnostics
+        return [
+            diag
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Name) and (diag := _check_binding(node)) is not None
+        ]
+
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed Name node, skipping the tree walk."""
+        # by_type guarantees the ast.Name key holds only Name nodes; cast()
+        # records that invariant for the type checker.
+        return [
+            diag
+            for node in cast("list[ast.Name]", analysis.by_type.get(ast.Name, []))
+            if (diag := _check_binding(node)) is not None
+        ]
+
+
+def _check_params(
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+) -> list[base.Diagnostic]:
+    """Return NAM003 diagnostics for single-character parameters of *node*."""
+    checked = (
+        *node.args.posonlyargs,
+        *node.args.args,
+        *node.args.kwonlyargs,
+    )
+    return [
+        base.Diagnostic(
+            rule_id="NAM003",
+            message=(
+                f"Parameter name `{arg.arg}` is not descriptive; use a meaningful name"
+            ),
+            line=arg.lineno,
+            col=arg.col_offset,
+            end_line=arg.end_lineno or arg.lineno,
+            end_col=arg.end_col_offset or arg.col_offset,
+            severity=base.Severity.WARNING,
+        )
+        for arg in checked
+        if _is_single_char_name(arg.arg)
+    ]
 
 
 class NAM003(base.Rule):
@@ -125,29 +199,20 @@ class NAM003(base.Rule):
 
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Return a diagnostic for every single-character parameter name."""
+        return [
+            diag
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            for diag in _check_params(node)
+        ]
+
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed function definition, skipping the tree walk."""
         diagnostics: list[base.Diagnostic] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                continue
-            checked = (
-                *node.args.posonlyargs,
-                *node.args.args,
-                *node.args.kwonlyargs,
-            )
-            diagnostics.extend(
-                base.Diagnostic(
-                    rule_id="NAM003",
-                    message=(
-                        f"Parameter name `{arg.arg}` is not descriptive;"
-                        f" use a meaningful name"
-                    ),
-                    line=arg.lineno,
-                    col=arg.col_offset,
-                    end_line=arg.end_lineno or arg.lineno,
-                    end_col=arg.end_col_offset or arg.col_offset,
-                    severity=base.Severity.WARNING,
-                )
-                for arg in checked
-                if len(arg.arg) == 1 and arg.arg != "_"
-            )
+        for func in analysis.functions:
+            diagnostics.extend(_check_params(func))
         return diagnostics
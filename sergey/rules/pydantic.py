@@ -1,10 +1,62 @@
 """Pydantic rules: PDT001, PDT002, PDT003."""
 
 import ast
-from typing import Final
+from typing import Final, cast
 
+from sergey.rules import analysis as analysis_mod
 from sergey.rules import base
 
+# ast.TryStar (try/except*) was added in Python 3.11.
+_TRY_TYPES: Final[frozenset[type[ast.AST]]] = frozenset(
+    {ast.Try, ast.TryStar} if hasattr(ast, "TryStar") else {ast.Try}
+)
+
+# Statement-bearing fields per compound statement type. Class definitions can
+# only live inside these bodies, so the scan never descends into expressions
+# and stays proportional to the statement count rather than the node count.
+_STMT_FIELDS: Final[dict[type[ast.AST], tuple[str, ...]]] = {
+    ast.FunctionDef: ("body",),
+    ast.AsyncFunctionDef: ("body",),
+    ast.ClassDef: ("body",),
+    ast.If: ("body", "orelse"),
+    ast.For: ("body", "orelse"),
+    ast.AsyncFor: ("body", "orelse"),
+    ast.While: ("body", "orelse"),
+    ast.With: ("body",),
+    ast.AsyncWith: ("body",),
+}
+
+
+def _find_classes(tree: ast.Module) -> list[ast.ClassDef]:
+    """Return all class definitions, descending only into statement fields."""
+    found: list[ast.ClassDef] = []
+    stack: list[ast.stmt] = list(tree.body)
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is ast.ClassDef:
+            # Membership on type(node) does not narrow for the type checker,
+            # so cast before the typed append; ast.Try also covers TryStar.
+            class_node = cast("ast.ClassDef", node)
+            found.append(class_node)
+            stack.extend(class_node.body)
+        elif node_type in _TRY_TYPES:
+            try_node = cast("ast.Try", node)
+            stack.extend(try_node.body)
+            stack.extend(try_node.orelse)
+            stack.extend(try_node.finalbody)
+            for handler in try_node.handlers:
+                stack.extend(handler.body)
+        elif node_type is ast.Match:
+            for case in cast("ast.Match", node).cases:
+                stack.extend(case.body)
+        else:
+            fields = _STMT_FIELDS.get(node_type)
+            if fields is not None:
+                for field in fields:
+                    stack.extend(getattr(node, field))
+    return found
+
 
 def _is_pydantic_model(node: ast.ClassDef) -> bool:
     """Return True if the class appears to subclass pydantic BaseModel."""
@@ -93,27 +145,94 @@ _MUTABLE_TYPES: Final[frozenset[str]] = frozenset(
 )
 
 
-def _mutable_types_in(annotation: ast.expr) -> list[str]:
-    """Return names of mutable types found anywhere in *annotation*.
+def _first_mutable_type(annotation: ast.expr) -> str | None:
+    """Return the first mutable type name found in *annotation*, or None.
 
-    Recurses into generic arguments, union syntax (``X | Y``), and
+    Descends into generic arguments, union syntax (``X | Y``), and
     ``Annotated`` / ``Optional`` wrappers so that e.g.
-    ``Optional[list[str]]`` is still flagged.
+    ``Optional[list[str]]`` is still flagged. Children are pushed in
+    reverse so the explicit stack preserves left-to-right discovery
+    order, and the walk stops at the first hit.
     """
-    if isinstance(annotation, ast.Name):
-        return [annotation.id] if annotation.id in _MUTABLE_TYPES else []
-    if isinstance(annotation, ast.Attribute):
-        return [annotation.attr] if annotation.attr in _MUTABLE_TYPES else []
-    if isinstance(annotation, ast.Subscript):
-        return _mutable_types_in(annotation.value) + _mutable_types_in(annotation.slice)
-    if isinstance(annotation, ast.BinOp) and isinstance(annotation.op, ast.BitOr):
-        return _mutable_types_in(annotation.left) + _mutable_types_in(annotation.right)
-    if isinstance(annotation, ast.Tuple):
-        found: list[str] = []
-        for elt in annotation.elts:
-            found.extend(_mutable_types_in(elt))
-        return found
-    return []
+    stack: list[ast.expr] = [annotation]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Name):
+            if node.id in _MUTABLE_TYPES:
+                return node.id
+        elif isinstance(node, ast.Attribute):
+            if node.attr in _MUTABLE_TYPES:
+                return node.attr
+        elif isinstance(node, ast.Subscript):
+            stack.append(node.slice)
+            stack.append(node.value)
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+            stack.append(node.right)
+            stack.append(node.left)
+        elif isinstance(node, ast.Tuple):
+            stack.extend(reversed(node.elts))
+    return None
+
+
+# Message templates, formatted at emission time. str.format caches the parsed
+# template per string, so the hot path only fills in the names.
+_NO_CONFIG_TEMPLATE: Final[str] = (
+    "Pydantic model `{name}` has no `model_config`;"
+    " add `model_config = ConfigDict(frozen=...)`"
+)
+_NOT_CONFIG_DICT_TEMPLATE: Final[str] = (
+    "Pydantic model `{name}` `model_config` is not a `ConfigDict(...)` call;"
+    " use `model_config = ConfigDict(frozen=...)`"
+)
+_MISSING_FROZEN_TEMPLATE: Final[str] = (
+    "Pydantic model `{name}` `model_config` does not set `frozen`;"
+    " add `frozen=True` or `frozen=False` explicitly"
+)
+_MUTABLE_FIELD_TEMPLATE: Final[str] = (
+    "Frozen model `{model}` field `{field}` uses mutable type `{type}`;"
+    " use an immutable alternative (e.g. `tuple` instead of `list`,"
+    " `frozenset` instead of `set`)"
+)
+_FIELD_FROZEN_TEMPLATE: Final[str] = (
+    "Field `{field}` in non-frozen model `{model}` does not declare"
+    " field-level frozen; add `Field(frozen=True)` or `Field(frozen=False)`"
+)
+
+
+def _check_model_config(node: ast.ClassDef) -> base.Diagnostic | None:
+    """Return a PDT001 diagnostic for a model missing a frozen setting."""
+    config_value = _find_model_config(node)
+    if config_value is None:
+        return base.Diagnostic(
+            rule_id="PDT001",
+            message=_NO_CONFIG_TEMPLATE.format(name=node.name),
+            line=node.lineno,
+            col=node.col_offset,
+            end_line=node.end_lineno or node.lineno,
+            end_col=node.end_col_offset or node.col_offset,
+            severity=base.Severity.WARNING,
+        )
+    if not _is_config_dict_call(config_value):
+        return base.Diagnostic(
+            rule_id="PDT001",
+            message=_NOT_CONFIG_DICT_TEMPLATE.format(name=node.name),
+            line=config_value.lineno,
+            col=config_value.col_offset,
+            end_line=config_value.end_lineno or config_value.lineno,
+            end_col=config_value.end_col_offset or config_value.col_offset,
+            severity=base.Severity.WARNING,
+        )
+    if isinstance(config_value, ast.Call) and not _has_frozen_kwarg(config_value):
+        return base.Diagnostic(
+            rule_id="PDT001",
+            message=_MISSING_FROZEN_TEMPLATE.format(name=node.name),
+            line=config_value.lineno,
+            col=config_value.col_offset,
+            end_line=config_value.end_lineno or config_value.lineno,
+            end_col=config_value.end_col_offset or config_value.col_offset,
+            severity=base.Severity.WARNING,
+        )
+    return None
 
 
 class PDT001(base.Rule):
@@ -143,69 +262,25 @@ class PDT001(base.Rule):
 
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Return a diagnostic for every Pydantic model missing a frozen setting."""
-        diagnostics: list[base.Diagnostic] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.ClassDef):
-                continue
-            if not _is_pydantic_model(node):
-                continue
-
-            config_value = _find_model_config(node)
-
-            if config_value is None:
-                diagnostics.append(
-                    base.Diagnostic(
-                        rule_id="PDT001",
-                        message=(
-                            f"Pydantic model `{node.name}` has no `model_config`;"
-                            f" add `model_config = ConfigDict(frozen=...)`"
-                        ),
-                        line=node.lineno,
-                        col=node.col_offset,
-                        end_line=node.end_lineno or node.lineno,
-                        end_col=node.end_col_offset or node.col_offset,
-                        severity=base.Severity.WARNING,
-                    )
-                )
-            elif not _is_config_dict_call(config_value):
-                diagnostics.append(
-                    base.Diagnostic(
-                        rule_id="PDT001",
-                        message=(
-                            f"Pydantic model `{node.name}` `model_config` is not a"
-                            f" `ConfigDict(...)` call;"
-                            f" use `model_config = ConfigDict(frozen=...)`"
-                        ),
-                        line=config_value.lineno,
-                        col=config_value.col_offset,
-                        end_line=config_value.end_lineno or config_value.lineno,
-                        end_col=(
-                            config_value.end_col_offset or config_value.col_offset
-                        ),
-                        severity=base.Severity.WARNING,
-                    )
-                )
-            elif isinstance(config_value, ast.Call) and not _has_frozen_kwarg(
-                config_value
-            ):
-                diagnostics.append(
-                    base.Diagnostic(
-                        rule_id="PDT001",
-                        message=(
-                            f"Pydantic model `{node.name}` `model_config` does not"
-                            f" set `frozen`; add `frozen=True` or `frozen=False`"
-                            f" explicitly"
-                        ),
-                        line=config_value.lineno,
-                        col=config_value.col_offset,
-                        end_line=config_value.end_lineno or config_value.lineno,
-                        end_col=(
-                            config_value.end_col_offset or config_value.col_offset
-                        ),
-                        severity=base.Severity.WARNING,
-                    )
-                )
-        return diagnostics
+        return [
+            diag
+            for node in _find_classes(tree)
+            if _is_pydantic_model(node)
+            and (diag := _check_model_config(node)) is not None
+        ]
+
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed class definition, skipping the tree walk."""
+        return [
+            diag
+            for node in analysis.classes
+            if _is_pydantic_model(node)
+            and (diag := _check_model_config(node)) is not None
+        ]
 
 
 def _check_frozen_field(
@@ -217,18 +292,14 @@ def _check_frozen_field(
         return None
     if stmt.annotation is None or _is_class_var(stmt.annotation):
         return None
-    mutable = _mutable_types_in(stmt.annotation)
-    if not mutable:
+    mutable = _first_mutable_type(stmt.annotation)
+    if mutable is None:
         return None
     ann = stmt.annotation
     return base.Diagnostic(
         rule_id="PDT002",
-        message=(
-            f"Frozen model `{model_name}` field"
-            f" `{stmt.target.id}` uses mutable type"
-            f" `{mutable[0]}`; use an immutable alternative"
-            f" (e.g. `tuple` instead of `list`,"
-            f" `frozenset` instead of `set`)"
+        message=_MUTABLE_FIELD_TEMPLATE.format(
+            model=model_name, field=stmt.target.id, type=mutable
         ),
         line=ann.lineno,
         col=ann.col_offset,
@@ -323,14 +394,25 @@ class PDT002(base.Rule):
 
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Return a diagnostic for every mutable field on a frozen model."""
-        diagnostics: list[base.Diagnostic] = []
-        try:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef) and _is_pydantic_model(node):
-                    diagnostics.extend(_check_frozen_model(node))
-        except Exception:  # noqa: BLE001, S110
-            pass
-        return diagnostics
+        return [
+            diag
+            for node in _find_classes(tree)
+            if _is_pydantic_model(node)
+            for diag in _check_frozen_model(node)
+        ]
+
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed class definition, skipping the tree walk."""
+        return [
+            diag
+            for node in analysis.classes
+            if _is_pydantic_model(node)
+            for diag in _check_frozen_model(node)
+        ]
 
 
 def _check_field_frozen(
@@ -347,12 +429,7 @@ def _check_field_frozen(
     ann = stmt.annotation
     return base.Diagnostic(
         rule_id="PDT003",
-        message=(
-            f"Field `{stmt.target.id}` in non-frozen model"
-            f" `{model_name}` does not declare field-level"
-            f" frozen; add `Field(frozen=True)`"
-            f" or `Field(frozen=False)`"
-        ),
+        message=_FIELD_FROZEN_TEMPLATE.format(field=stmt.target.id, model=model_name),
         line=ann.lineno,
         col=ann.col_offset,
         end_line=ann.end_lineno or ann.lineno,
@@ -413,11 +490,22 @@ class PDT003(base.Rule):
 
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Return a diagnostic for each field missing a field-level frozen setting."""
-        diagnostics: list[base.Diagnostic] = []
-        try:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef) and _is_pydantic_model(node):
-                    diagnostics.extend(_check_non_frozen_model(node))
-        except Exception:  # noqa: BLE001, S110
-            pass
-        return diagnostics
+        return [
+            diag
+            for node in _find_classes(tree)
+            if _is_pydantic_model(node)
+            for diag in _check_non_frozen_model(node)
+        ]
+
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed class definition, skipping the tree walk."""
+        return [
+            diag
+            for node in analysis.classes
+            if _is_pydantic_model(node)
+            for diag in _check_non_frozen_model(node)
+        ]
@@ -1,13 +1,27 @@
 """Structure rules: STR002, STR003, STR004, STR005, STR006, STR007."""
 
 import ast
-from collections.abc import Iterator
-from typing import Final
+import functools
+import sys
+from collections.abc import Callable, Iterator
+from typing import Final, cast
 
+from sergey.rules import analysis as analysis_mod
 from sergey.rules import base
 
 _MAX_DEPTH: Final[int] = 4
 
+# Substrings that any nesting construct must put in the source text. False
+# positives (e.g. "if" inside an identifier) only mean the walk still runs.
+_NESTING_KEYWORDS: Final[tuple[str, ...]] = (
+    "for",
+    "while",
+    "if",
+    "with",
+    "try",
+    "match",
+)
+
 _SCOPE_TYPES: Final[tuple[type[ast.AST], ...]] = (
     ast.FunctionDef,
     ast.AsyncFunctionDef,
@@ -31,72 +45,188 @@ _OTHER_NESTING: Final[tuple[type[ast.AST], ...]] = (
     *_TRY_STAR,
 )
 
+# AST nodes are never subclassed here, so the hot loops dispatch on exact
+# type via frozenset membership instead of isinstance tuple scans.
+_SCOPE_SET: Final[frozenset[type[ast.AST]]] = frozenset(_SCOPE_TYPES)
+
+
+@functools.cache
+def _str002_message(depth: int) -> str:
+    """Return the STR002 message for *depth*, cached across violations."""
+    return (
+        f"Nesting depth {depth} exceeds the maximum of {_MAX_DEPTH};"
+        f" extract logic to reduce nesting"
+    )
+
 
 def _make_diagnostic(node: ast.stmt, depth: int) -> base.Diagnostic:
+    # Positional construction: this runs once per violation and Diagnostic is
+    # slotted, so skip the keyword-matching overhead of the generated __init__.
+    lineno = node.lineno
+    col_offset = node.col_offset
     return base.Diagnostic(
-        rule_id="STR002",
-        message=(
-            f"Nesting depth {depth} exceeds the maximum of {_MAX_DEPTH};"
-            f" extract logic to reduce nesting"
-        ),
-        line=node.lineno,
-        col=node.col_offset,
-        end_line=node.end_lineno or node.lineno,
-        end_col=node.end_col_offset or node.col_offset,
-        severity=base.Severity.WARNING,
+        "STR002",
+        _str002_message(depth),
+        lineno,
+        col_offset,
+        node.end_lineno or lineno,
+        node.end_col_offset or col_offset,
+        base.Severity.WARNING,
     )
 
 
-def _dispatch(node: ast.AST, depth: int, diagnostics: list[base.Diagnostic]) -> None:
-    """Dispatch a single AST node, tracking control-flow nesting depth."""
-    if isinstance(node, _SCOPE_TYPES):
-        # Function, class, or lambda bodies reset the depth counter.
-        for child in ast.iter_child_nodes(node):
-            _dispatch(child, 0, diagnostics)
-    elif isinstance(node, ast.If):
-        _enter_if(node, depth, diagnostics, is_elif=False)
-    elif isinstance(node, _OTHER_NESTING):
-        _enter(node, depth, diagnostics)
-    else:
-        for child in ast.iter_child_nodes(node):
-            _dispatch(child, depth, diagnostics)
+_Stack = list[tuple[ast.stmt, int]]
 
+# Unions mirroring the dispatch frozensets. Membership tests on type(node)
+# do not narrow for the type checker, so the walkers cast to these before
+# touching statement fields; casting to ast.Try also covers ast.TryStar,
+# which exposes the same fields.
+_BodyOrElse = ast.If | ast.For | ast.AsyncFor | ast.While
+_WithStmt = ast.With | ast.AsyncWith
+_ScopeStmt = ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
+
+
+def _stmt_children(node: ast.stmt) -> list[ast.stmt]:
+    """Return the statement children of a nesting construct, in source order.
+
+    Expressions cannot contain compound statements (lambdas can only hold
+    expressions), so a diagnostic can never originate below one; walking
+    statement fields alone keeps the scan proportional to the statement
+    count rather than the node count.
+    """
+    node_type = type(node)
+    if node_type in _BODY_ORELSE_SET:
+        branch = cast("_BodyOrElse", node)
+        return [*branch.body, *branch.orelse]
+    if node_type in _WITH_SET:
+        return cast("_WithStmt", node).body
+    if node_type in _TRY_SET:
+        try_node = cast("ast.Try", node)
+        children = [*try_node.body]
+        for handler in try_node.handlers:
+            children.extend(handler.body)
+        children.extend(try_node.orelse)
+        children.extend(try_node.finalbody)
+        return children
+    # ast.Match
+    return [stmt for case in cast("ast.Match", node).cases for stmt in case.body]
+
+
+def _scope_h(
+    node: ast.stmt,
+    _depth: int,
+    stack: _Stack,
+    _diagnostics: list[base.Diagnostic],
+) -> None:
+    """Push the body of a function or class: its statements reset depth."""
+    stack.extend((stmt, 0) for stmt in reversed(cast("_ScopeStmt", node).body))
 
-def _enter(node: ast.AST, depth: int, diagnostics: list[base.Diagnostic]) -> None:
-    """Enter a nesting construct, incrementing depth and emitting if over limit."""
-    new_depth = depth + 1
-    if new_depth > _MAX_DEPTH and depth == _MAX_DEPTH:
-        diagnostics.append(_make_diagnostic(node, new_depth))  # type: ignore[arg-type]
-    for child in ast.iter_child_nodes(node):
-        _dispatch(child, new_depth, diagnostics)
 
+def _push_stmts_only(node: ast.stmt, depth: int, stack: _Stack) -> None:
+    """Push only the statement children of an already-flagged *node*.
 
-def _enter_if(
+    Below a flagged block no further diagnostic can fire until a def or
+    class resets the depth, and those occur only in statement positions
+    (lambdas cannot contain compound statements), so expression subtrees
+    are pruned entirely.
+    """
+    node_type = type(node)
+    if node_type in _BODY_ORELSE_SET:
+        branch = cast("_BodyOrElse", node)
+        stack.extend((stmt, depth) for stmt in branch.body)
+        stack.extend((stmt, depth) for stmt in branch.orelse)
+    elif node_type in _WITH_SET:
+        stack.extend((stmt, depth) for stmt in cast("_WithStmt", node).body)
+    elif node_type in _TRY_SET:
+        try_node = cast("ast.Try", node)
+        stack.extend((stmt, depth) for stmt in try_node.body)
+        stack.extend((stmt, depth) for stmt in try_node.orelse)
+        stack.extend((stmt, depth) for stmt in try_node.finalbody)
+        for handler in try_node.handlers:
+            stack.extend((stmt, depth) for stmt in handler.body)
+    elif node_type is ast.Match:
+        for case in cast("ast.Match", node).cases:
+            stack.extend((stmt, depth) for stmt in case.body)
+
+
+def _if_h(
     node: ast.If,
     depth: int,
+    stack: _Stack,
     diagnostics: list[base.Diagnostic],
-    *,
-    is_elif: bool,
 ) -> None:
-    """Enter an If node, treating elif branches at the same depth as the if.
+    """Push an elif chain at a single depth level.
 
-    This prevents elif chains from being penalised as extra nesting levels.
-    Only the leading `if` emits a diagnostic when over the limit.
+    elif branches are flattened inline at the same depth as their leading
+    `if`, so a chain only adds one level and only the leading `if` can
+    emit a diagnostic.
     """
     new_depth = depth + 1
-    if not is_elif and new_depth > _MAX_DEPTH and depth == _MAX_DEPTH:
-        diagnostics.append(_make_diagnostic(node, new_depth))
+    if new_depth > _MAX_DEPTH:
+        if depth == _MAX_DEPTH:
+            diagnostics.append(_make_diagnostic(node, new_depth))
+        _push_stmts_only(node, new_depth, stack)
+        return
+    chain: list[ast.stmt] = []
+    while True:
+        chain.extend(node.body)
+        orelse = node.orelse
+        if len(orelse) == 1 and type(orelse[0]) is ast.If:
+            node = orelse[0]
+        else:
+            chain.extend(orelse)
+            break
+    stack.extend((stmt, new_depth) for stmt in reversed(chain))
+
+
+def _nesting_h(
+    node: ast.stmt,
+    depth: int,
+    stack: _Stack,
+    diagnostics: list[base.Diagnostic],
+) -> None:
+    """Push children of a nesting construct one level deeper, emitting at 5."""
+    depth += 1
+    if depth > _MAX_DEPTH:
+        if depth == _MAX_DEPTH + 1:
+            diagnostics.append(_make_diagnostic(node, depth))
+        _push_stmts_only(node, depth, stack)
+        return
+    stack.extend((stmt, depth) for stmt in reversed(_stmt_children(node)))
+
+
+# Lambdas reset depth like other scopes but can only appear in expression
+# position, which the statement-only walk never visits, so they need no entry.
+_HANDLERS: Final[dict[type[ast.AST], Callable[..., None]]] = {
+    ast.FunctionDef: _scope_h,
+    ast.AsyncFunctionDef: _scope_h,
+    ast.ClassDef: _scope_h,
+    **dict.fromkeys(_OTHER_NESTING, _nesting_h),
+    ast.If: _if_h,
+}
 
-    _dispatch(node.test, new_depth, diagnostics)
-    for stmt in node.body:
-        _dispatch(stmt, new_depth, diagnostics)
 
-    if len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If):
-        # elif: use the same base depth so it counts as the same level.
-        _enter_if(node.orelse[0], depth, diagnostics, is_elif=True)
-    else:
-        for stmt in node.orelse:
-            _dispatch(stmt, new_depth, diagnostics)
+def _walk(tree: ast.Module) -> list[base.Diagnostic]:
+    """Iteratively walk *tree*, returning STR002 depth diagnostics.
+
+    An explicit stack replaces the visitor recursion, so each node costs a
+    loop iteration instead of a call frame and deeply nested trees cannot
+    hit the recursion limit. Only statement children are ever pushed:
+    simple statements are popped and dropped in one dict miss, and
+    expression subtrees are never visited at all. Children are pushed in
+    reverse so visitation order matches the recursive walk.
+    """
+    diagnostics: list[base.Diagnostic] = []
+    # Module's only statement-bearing field is body (type_ignores holds no
+    # AST nodes), so seed the stack from it directly.
+    stack: _Stack = [(stmt, 0) for stmt in reversed(tree.body)]
+    get_handler = _HANDLERS.get
+    while stack:
+        node, depth = stack.pop()
+        handler = get_handler(type(node))
+        if handler is not None:
+            handler(node, depth, stack, diagnostics)
+    return diagnostics
 
 
 class STR002(base.Rule):
@@ -128,50 +258,113 @@ class STR002(base.Rule):
 
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Return a diagnostic for each block that exceeds the maximum nesting depth."""
-        diagnostics: list[base.Diagnostic] = []
-        try:
-            for child in ast.iter_child_nodes(tree):
-                _dispatch(child, 0, diagnostics)
-        except Exception:  # noqa: BLE001, S110
-            pass
-        return diagnostics
+        # A depth violation needs nesting keywords in the source; one C-level
+        # substring scan skips the walk entirely for flat files.
+        if not any(keyword in source for keyword in _NESTING_KEYWORDS):
+            return []
+        return _walk(tree)
 
 
 _DEFAULT_MAX_TRY_BODY: Final[int] = 4
 
+# Statement types that contribute nested statement lists to the STR003 count.
+_COMPOUND_TYPES: Final[tuple[type[ast.AST], ...]] = (ast.If, *_OTHER_NESTING)
+_COMPOUND_SET: Final[frozenset[type[ast.AST]]] = frozenset(_COMPOUND_TYPES)
+
+_BODY_ORELSE_SET: Final[frozenset[type[ast.AST]]] = frozenset(
+    {ast.If, ast.For, ast.AsyncFor, ast.While}
+)
+_WITH_SET: Final[frozenset[type[ast.AST]]] = frozenset({ast.With, ast.AsyncWith})
+_TRY_SET: Final[frozenset[type[ast.AST]]] = frozenset({ast.Try, *_TRY_STAR})
+
+
+# Statement-bearing fields per node type. Expressions cannot contain
+# statements, so walkers consulting this never descend into them.
+_STMT_FIELDS: Final[dict[type[ast.AST], tuple[str, ...]]] = {
+    ast.FunctionDef: ("body",),
+    ast.AsyncFunctionDef: ("body",),
+    ast.ClassDef: ("body",),
+    ast.If: ("body", "orelse"),
+    ast.For: ("body", "orelse"),
+    ast.AsyncFor: ("body", "orelse"),
+    ast.While: ("body", "orelse"),
+    ast.With: ("body",),
+    ast.AsyncWith: ("body",),
+}
+
 
-def _child_stmt_lists(node: ast.AST) -> list[list[ast.stmt]]:
-    """Return child statement lists of a compound statement node.
+def _find_tries(tree: ast.Module) -> list[ast.Try]:
+    """Return all try statements, descending only into statement fields.
 
-    Used by ``_count_stmts`` to recurse into nested control flow without
-    crossing function or class scope boundaries.
+    Most nodes in a typical file are expressions, which cannot contain a
+    ``try``; skipping them makes the scan proportional to the statement
+    count rather than the node count.
     """
-    if isinstance(node, (ast.If, ast.For, ast.AsyncFor, ast.While)):
-        return [node.body, node.orelse]
-    if isinstance(node, (ast.With, ast.AsyncWith)):
-        return [node.body]
-    if isinstance(node, ast.Try):
-        bodies: list[list[ast.stmt]] = [node.body, node.orelse, node.finalbody]
-        bodies.extend(handler.body for handler in node.handlers)
-        return bodies
-    if hasattr(ast, "TryStar") and isinstance(node, ast.TryStar):
-        ts_bodies: list[list[ast.stmt]] = [node.body, node.orelse, node.finalbody]
-        ts_bodies.extend(handler.body for handler in node.handlers)
-        return ts_bodies
-    if isinstance(node, ast.Match):
-        return [case.body for case in node.cases]
-    return []
+    tries: list[ast.Try] = []
+    stack: list[ast.stmt] = list(tree.body)
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type in _TRY_SET:
+            try_node = cast("ast.Try", node)
+            if node_type is ast.Try:
+                tries.append(try_node)
+            stack.extend(try_node.body)
+            stack.extend(try_node.orelse)
+            stack.extend(try_node.finalbody)
+            for handler in try_node.handlers:
+                stack.extend(handler.body)
+        elif node_type is ast.Match:
+            for case in cast("ast.Match", node).cases:
+                stack.extend(case.body)
+        else:
+            fields = _STMT_FIELDS.get(node_type)
+            if fields is not None:
+                for field in fields:
+                    stack.extend(getattr(node, field))
+    return tries
+
+
+@functools.cache
+def _str003_message(stmt_count: int, max_body_stmts: int) -> str:
+    """Return the STR003 message for a count/threshold pair, cached."""
+    return (
+        f"try body has {stmt_count} statements"
+        f" (maximum {max_body_stmts});"
+        f" extract logic to narrow the guarded scope"
+    )
 
 
 def _count_stmts(stmts: list[ast.stmt]) -> int:
-    """Count statements recursively, not descending into new scopes."""
+    """Count statements in nested control flow, not descending into new scopes.
+
+    Iterative with a worklist stack: child statements are pushed directly,
+    with no intermediate list-of-lists allocation per compound node.
+    """
     total = 0
-    for stmt in stmts:
+    stack = list(stmts)
+    while stack:
+        stmt = stack.pop()
         total += 1
-        if isinstance(stmt, _SCOPE_TYPES):
+        node_type = type(stmt)
+        if node_type in _SCOPE_SET:
             continue
-        for child_list in _child_stmt_lists(stmt):
-            total += _count_stmts(child_list)
+        if node_type in _BODY_ORELSE_SET:
+            branch = cast("_BodyOrElse", stmt)
+            stack.extend(branch.body)
+            stack.extend(branch.orelse)
+        elif node_type in _WITH_SET:
+            stack.extend(cast("_WithStmt", stmt).body)
+        elif node_type in _TRY_SET:
+            try_node = cast("ast.Try", stmt)
+            stack.extend(try_node.body)
+            stack.extend(try_node.orelse)
+            stack.extend(try_node.finalbody)
+            for handler in try_node.handlers:
+                stack.extend(handler.body)
+        elif node_type is ast.Match:
+            for case in cast("ast.Match", stmt).cases:
+                stack.extend(case.body)
     return total
 
 
@@ -227,41 +420,56 @@ class STR003(base.Rule):
             A new STR003 instance with the configured threshold, or self if
             the option is absent or not an integer.
         """
-        max_body_stmts = options.get("max_body_stmts", self._max_body_stmts)
+        max_body_stmts = options.get("max_body_stmts")
         if isinstance(max_body_stmts, int):
             return STR003(max_body_stmts=max_body_stmts)
         return self
 
     def _check_try_node(self, node: ast.Try) -> list[base.Diagnostic]:
         """Return a diagnostic if *node*'s body exceeds the statement limit."""
-        stmt_count = _count_stmts(node.body)
+        body = node.body
+        if any(type(stmt) in _COMPOUND_SET for stmt in body):
+            stmt_count = _count_stmts(body)
+        else:
+            # Flat bodies are the common case: with no compound statements
+            # the recursive count is exactly the body length.
+            stmt_count = len(body)
         if stmt_count <= self._max_body_stmts:
             return []
+        lineno = node.lineno
+        col_offset = node.col_offset
         return [
             base.Diagnostic(
-                rule_id="STR003",
-                message=(
-                    f"try body has {stmt_count} statements"
-                    f" (maximum {self._max_body_stmts});"
-                    f" extract logic to narrow the guarded scope"
-                ),
-                line=node.lineno,
-                col=node.col_offset,
-                end_line=node.end_lineno or node.lineno,
-                end_col=node.end_col_offset or node.col_offset,
-                severity=base.Severity.WARNING,
+                "STR003",
+                _str003_message(stmt_count, self._max_body_stmts),
+                lineno,
+                col_offset,
+                node.end_lineno or lineno,
+                node.end_col_offset or col_offset,
+                base.Severity.WARNING,
             )
         ]
 
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Return a diagnostic for every try body exceeding the statement limit."""
+        # A try statement requires the keyword in the source text; one
+        # C-level substring scan skips the statement walk for try-free files.
+        if "try" not in source:
+            return []
         diagnostics: list[base.Diagnostic] = []
-        try:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Try):
-                    diagnostics.extend(self._check_try_node(node))
-        except Exception:  # noqa: BLE001, S110
-            pass
+        for node in _find_tries(tree):
+            diagnostics.extend(self._check_try_node(node))
+        return diagnostics
+
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed try statement, skipping the tree walk."""
+        diagnostics: list[base.Diagnostic] = []
+        for node in analysis.tries:
+            diagnostics.extend(self._check_try_node(node))
         return diagnostics
 
 
@@ -269,8 +477,11 @@ class STR003(base.Rule):
 # STR004 — prefer tuples/frozensets for unmodified lists/sets
 # ---------------------------------------------------------------------------
 
+# Interned so membership tests against parser-interned attribute names can
+# short-circuit on identity before falling back to string comparison.
 _LIST_MUTATING_METHODS: Final[frozenset[str]] = frozenset(
-    {
+    sys.intern(name)
+    for name in (
         "append",
         "clear",
         "extend",
@@ -279,11 +490,12 @@ _LIST_MUTATING_METHODS: Final[frozenset[str]] = frozenset(
         "remove",
         "reverse",
         "sort",
-    }
+    )
 )
 
 _SET_MUTATING_METHODS: Final[frozenset[str]] = frozenset(
-    {
+    sys.intern(name)
+    for name in (
         "add",
         "clear",
         "difference_update",
@@ -293,7 +505,7 @@ _SET_MUTATING_METHODS: Final[frozenset[str]] = frozenset(
         "remove",
         "symmetric_difference_update",
         "update",
-    }
+    )
 )
 
 
@@ -316,16 +528,21 @@ def _has_name_ref(node: ast.AST, name: str) -> bool:
     return any(_has_name_ref(child, name) for child in ast.iter_child_nodes(node))
 
 
-def _is_name_used_in_nested_scope(node: ast.AST, name: str) -> bool:
-    """Return True if *name* is referenced inside a nested scope under *node*."""
+def _nested_scope_names(node: ast.AST) -> set[str]:
+    """Return all names referenced inside nested scopes under *node*.
+
+    Collected once per function so candidate lookups are set membership
+    tests instead of repeated subtree walks.
+    """
+    names: set[str] = set()
     for child in ast.iter_child_nodes(node):
         if isinstance(child, _SCOPE_TYPES):
-            for inner in ast.walk(child):
-                if isinstance(inner, ast.Name) and inner.id == name:
-                    return True
-        elif _is_name_used_in_nested_scope(child, name):
-            return True
-    return False
+            names.update(
+                inner.id for inner in ast.walk(child) if isinstance(inner, ast.Name)
+            )
+        else:
+            names.update(_nested_scope_names(child))
+    return names
 
 
 def _has_name_in_target(target: ast.AST, name: str) -> bool:
@@ -494,14 +711,15 @@ def _should_skip(
     name: str,
     assign_node: ast.stmt,
     mutating_methods: frozenset[str],
+    nested_scope_names: set[str],
 ) -> bool:
     """Return True if the mutable literal should *not* be flagged."""
     return (
-        _has_global_or_nonlocal(func, name)
+        name in nested_scope_names
+        or _has_global_or_nonlocal(func, name)
         or _is_name_rebound(func, name, assign_node)
         or _is_mutated(func, name, mutating_methods)
         or _is_in_function_output(func, name)
-        or _is_name_used_in_nested_scope(func, name)
         or _can_escape(func, name)
     )
 
@@ -512,6 +730,56 @@ _IMMUTABLE_SUGGESTION: Final[dict[type[ast.expr], tuple[str, str, frozenset[str]
 }
 
 
+_FUNCTION_SET: Final[frozenset[type[ast.AST]]] = frozenset(
+    {ast.FunctionDef, ast.AsyncFunctionDef}
+)
+
+
+def _find_functions(
+    tree: ast.Module,
+) -> list[ast.FunctionDef | ast.AsyncFunctionDef]:
+    """Return all function definitions, descending only into statement fields.
+
+    Same shape as :func:`_find_tries`: expressions cannot contain a ``def``,
+    so the scan stays proportional to the statement count. Function and class
+    bodies are descended into so nested definitions are still found.
+    """
+    functions: list[ast.FunctionDef | ast.AsyncFunctionDef] = []
+    stack: list[ast.stmt] = list(tree.body)
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type in _FUNCTION_SET:
+            functions.append(cast("ast.FunctionDef | ast.AsyncFunctionDef", node))
+        if node_type in _TRY_SET:
+            try_node = cast("ast.Try", node)
+            stack.extend(try_node.body)
+            stack.extend(try_node.orelse)
+            stack.extend(try_node.finalbody)
+            for handler in try_node.handlers:
+                stack.extend(handler.body)
+        elif node_type is ast.Match:
+            for case in cast("ast.Match", node).cases:
+                stack.extend(case.body)
+        else:
+            fields = _STMT_FIELDS.get(node_type)
+            if fields is not None:
+                for field in fields:
+                    stack.extend(getattr(node, field))
+    return functions
+
+
+def _str004_cannot_match(source: str) -> bool:
+    """Return True if the source cannot contain an STR004 violation.
+
+    The rule only fires on ``[...]``/``{...}`` literals inside a function
+    body, so a source without a literal bracket or without ``def`` (``async
+    def`` contains it) never produces a diagnostic. The substring scans run
+    in C and are far cheaper than walking the tree of a clean file.
+    """
+    return "def" not in source or ("[" not in source and "{" not in source)
+
+
 class STR004(base.Rule):
     """Flag list/set literals in functions that are never modified and not returned.
 
@@ -555,11 +823,28 @@ class STR004(base.Rule):
 
     def check(self, tree: ast.Module, source: str) -> list[base.Diagnostic]:
         """Return a diagnostic for each unmodified mutable literal."""
+        if _str004_cannot_match(source):
+            return []
         diagnostics: list[base.Diagnostic] = []
         try:
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    diagnostics.extend(self._check_function(node))
+            for func in _find_functions(tree):
+                diagnostics.extend(self._check_function(func))
+        except Exception:  # noqa: BLE001, S110
+            pass
+        return diagnostics
+
+    def check_analysis(
+        self,
+        analysis: analysis_mod.Analysis,
+        source: str,
+    ) -> list[base.Diagnostic]:
+        """Check every indexed function definition, skipping the tree walk."""
+        if _str004_cannot_match(source):
+            return []
+        diagnostics: list[base.Diagnostic] = []
+        try:
+            for func in analysis.functions:
+                diagnostics.extend(self._check_function(func))
         except Exception:  # noqa: BLE001, S110
             pass
         return diagnostics
@@ -570,25 +855,30 @@ class STR004(base.Rule):
     ) -> list[base.Diagnostic]:
         """Check a single function for unmodified mutable literals."""
         candidates = _collect_literal_assignments(func)
+        if not candidates:
+            return []
+        nested_scope_names = _nested_scope_names(func)
         diagnostics: list[base.Diagnostic] = []
         for name, assign_node, literal_type in candidates:
             kind_label, suggestion, mutating_methods = _IMMUTABLE_SUGGESTION[
                 literal_type
             ]
-            if _should_skip(func, name, assign_node, mutating_methods):
+            if _should_skip(
+                func, name, assign_node, mutating_methods, nested_scope_names
+            ):
                 continue
+            lineno = assign_node.lineno
+            col_offset = assign_node.col_offset
             diagnostics.append(
                 base.Diagnostic(
-                    rule_id="STR004",
-                    message=(
-                        f"{kind_label} `{name}` is never modified;"
-                        f" use a {suggestion} for immutability"
-                    ),
-                    line=assign_node.lineno,
-                    col=assign_node.col_offset,
-                    end_line=assign_node.end_lineno or assign_node.lineno,
-                    end_col=assign_node.end_col_offset or assign_node.col_offset,
-                    severity=base.Severity.WARNING,
+                    "STR004",
+                    f"{kind_label} `{name}` is never modified;"
+                    f" use a {suggestion} for immutability",
+                    lineno,
+                    col_offset,
+                    assign_node.end_lineno or lineno,
+                    assign_node.end_col_offset or col_offset,
+                    base.Severity.WARNING,
                 )
             )
         return diagnostics
@@ -1,5 +1,8 @@
 """pygls LSP server for sergey."""
 
+import asyncio
+from typing import Final
+
 from lsprotocol import types
 from pygls.lsp import server as pygls_server
 
@@ -14,30 +17,77 @@ analyzer = sergey_analyzer.Analyzer(
     rules=sergey_config.filter_rules(rules.ALL_RULES, _cfg)
 )
 
+# Last analyzed source hash and diagnostics per open document, so a
+# did_change that does not alter the text (or a redundant re-publish)
+# skips the reparse and rule run entirely.
+_LAST: dict[str, tuple[int, list[base.Diagnostic]]] = {}
+
+# Editors send did_change per keystroke; wait this long for the burst to
+# settle before re-analyzing, so only the final state of a typing burst
+# costs a full analysis.
+_DEBOUNCE_SECONDS: Final[float] = 0.15
+
+# Change counter per URI; a debounced handler only publishes when no newer
+# change arrived while it slept.
+_CHANGE_SEQ: dict[str, int] = {}
+
+# Fingerprint of the last-published diagnostics per URI; re-sending an
+# identical set would only cost serialization and editor re-rendering. The
+# full field tuples are stored rather than their hash so equal fingerprints
+# mean equal diagnostics — no hash-collision false negatives.
+_PublishSig = tuple[tuple[str, str, int, int, int, int, base.Severity], ...]
+_LAST_PUB: dict[str, _PublishSig] = {}
+
+
+# Built once: _to_lsp runs per diagnostic per publish, and rebuilding this
+# mapping there meant a dict allocation for every conversion.
+_SEV_MAP: Final[dict[base.Severity, types.DiagnosticSeverity]] = {
+    base.Severity.ERROR: types.DiagnosticSeverity.Error,
+    base.Severity.WARNING: types.DiagnosticSeverity.Warning,
+    base.Severity.INFORMATION: types.DiagnosticSeverity.Information,
+    base.Severity.HINT: types.DiagnosticSeverity.Hint,
+}
+
+# Local aliases skip the per-conversion module attribute lookups.
+_Diagnostic = types.Diagnostic
+_Range = types.Range
+_Position = types.Position
+
 
 def _to_lsp(diag: base.Diagnostic) -> types.Diagnostic:
     """Convert a sergey Diagnostic to an LSP Diagnostic."""
-    severity_map = {
-        base.Severity.ERROR: types.DiagnosticSeverity.Error,
-        base.Severity.WARNING: types.DiagnosticSeverity.Warning,
-        base.Severity.INFORMATION: types.DiagnosticSeverity.Information,
-        base.Severity.HINT: types.DiagnosticSeverity.Hint,
-    }
-    return types.Diagnostic(
-        range=types.Range(
-            start=types.Position(line=diag.line - 1, character=diag.col),
-            end=types.Position(line=diag.end_line - 1, character=diag.end_col),
+    return _Diagnostic(
+        range=_Range(
+            start=_Position(line=diag.line - 1, character=diag.col),
+            end=_Position(line=diag.end_line - 1, character=diag.end_col),
         ),
         message=f"{diag.rule_id} {diag.message}",
-        severity=severity_map[diag.severity],
+        severity=_SEV_MAP[diag.severity],
         source="sergey",
     )
 
 
-def _publish(ls: pygls_server.LanguageServer, uri: str) -> None:
-    """Analyze a document and publish diagnostics to the client."""
-    source = ls.workspace.get_text_document(uri).source
-    diagnostics = analyzer.analyze(source)
+def _send(
+    ls: pygls_server.LanguageServer,
+    uri: str,
+    diagnostics: list[base.Diagnostic],
+) -> None:
+    """Publish diagnostics unless they match the last-published set."""
+    sig: _PublishSig = tuple(
+        (
+            diag.rule_id,
+            diag.message,
+            diag.line,
+            diag.col,
+            diag.end_line,
+            diag.end_col,
+            diag.severity,
+        )
+        for diag in diagnostics
+    )
+    if _LAST_PUB.get(uri) == sig:
+        return
+    _LAST_PUB[uri] = sig
     ls.text_document_publish_diagnostics(
         types.PublishDiagnosticsParams(
             uri=uri,
@@ -46,6 +96,19 @@ def _publish(ls: pygls_server.LanguageServer, uri: str) -> None:
     )
 
 
+def _publish(ls: pygls_server.LanguageServer, uri: str) -> None:
+    """Analyze a document and publish diagnostics to the client."""
+    source = ls.workspace.get_text_document(uri).source
+    source_hash = hash(source)
+    cached = _LAST.get(uri)
+    if cached is not None and cached[0] == source_hash:
+        diagnostics = cached[1]
+    else:
+        diagnostics = analyzer.analyze(source)
+        _LAST[uri] = (source_hash, diagnostics)
+    _send(ls, uri, diagnostics)
+
+
 @server.feature(types.TEXT_DOCUMENT_DID_OPEN)
 def did_open(
     ls: pygls_server.LanguageServer,
@@ -56,12 +119,32 @@ def did_open(
 
 
 @server.feature(types.TEXT_DOCUMENT_DID_CHANGE)
-def did_change(
+async def did_change(
     ls: pygls_server.LanguageServer,
     params: types.DidChangeTextDocumentParams,
 ) -> None:
-    """Re-analyze a document after every change."""
-    _publish(ls, params.text_document.uri)
+    """Re-analyze a document after changes, debounced to coalesce bursts."""
+    uri = params.text_document.uri
+    seq = _CHANGE_SEQ.get(uri, 0) + 1
+    _CHANGE_SEQ[uri] = seq
+    await asyncio.sleep(_DEBOUNCE_SECONDS)
+    if _CHANGE_SEQ.get(uri) != seq:
+        return
+    source = ls.workspace.get_text_document(uri).source
+    source_hash = hash(source)
+    cached = _LAST.get(uri)
+    if cached is not None and cached[0] == source_hash:
+        diagnostics = cached[1]
+    else:
+        # Analyze off the event loop so other LSP traffic is not blocked
+        # behind a long analysis of a large file.
+        loop = asyncio.get_running_loop()
+        diagnostics = await loop.run_in_executor(None, analyzer.analyze, source)
+        if _CHANGE_SEQ.get(uri) != seq:
+            # Superseded while analyzing; the newer change will publish.
+            return
+        _LAST[uri] = (source_hash, diagnostics)
+    _send(ls, uri, diagnostics)
 
 
 @server.feature(types.TEXT_DOCUMENT_DID_CLOSE)
@@ -70,6 +153,9 @@ def did_close(
     params: types.DidCloseTextDocumentParams,
 ) -> None:
     """Clear diagnostics when a document is closed."""
+    _LAST.pop(params.text_document.uri, None)
+    _CHANGE_SEQ.pop(params.text_document.uri, None)
+    _LAST_PUB.pop(params.text_document.uri, None)
     ls.text_document_publish_diagnostics(
         types.PublishDiagnosticsParams(uri=params.text_document.uri, diagnostics=[])
     )
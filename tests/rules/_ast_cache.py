@@ -0,0 +1,64 @@
+"""Shared AST parsing cache for rule tests.
+
+Rule checks never mutate the tree they receive, so test modules can share
+one parsed ``ast.Module`` per distinct source string instead of
+re-tokenizing the same snippets for every rule and every test.
+"""
+
+import ast
+import functools
+import textwrap
+
+from sergey.rules import analysis as analysis_mod
+from sergey.rules import base
+
+
+def dedent(source: str) -> str:
+    """Dedent source, skipping the scan when no line starts with whitespace.
+
+    Most test snippets are one-line literals with nothing to strip;
+    textwrap.dedent would scan them twice for no effect.
+    """
+    if "\n " in source or "\n\t" in source:
+        return textwrap.dedent(source)
+    return source
+
+
+@functools.cache
+def parse(source: str) -> ast.Module:
+    """Dedent and parse source, caching one tree per distinct snippet."""
+    return ast.parse(dedent(source))
+
+
+def _position(diag: base.Diagnostic) -> tuple[int, int, int, int, str]:
+    """Sort key mirroring the analyzer's (line, col) publish order."""
+    return (diag.line, diag.col, diag.end_line, diag.end_col, diag.rule_id)
+
+
+@functools.cache
+def diags(rule: base.Rule, source: str) -> tuple[base.Diagnostic, ...]:
+    """Run *rule* on *source* once per pair, caching the diagnostics.
+
+    Metadata tests commonly assert message, line, and rule_id of the same
+    diagnostics in separate tests; with this cache the rule runs once for
+    the whole triple. Rule instances hash by identity, so pass the shared
+    module-level singletons.
+
+    The diagnostics are computed through both entry points — legacy
+    ``check`` and the Analysis-backed ``check_analysis`` that the analyzer
+    dispatches to in production — and asserted equal, so every test going
+    through this helper also guards the override against drifting from the
+    plain tree walk. The two paths may emit in different traversal orders
+    (the analyzer sorts by position before publishing), so the comparison
+    sorts both sides the same way first.
+    """
+    tree = parse(source)
+    result = tuple(rule.check(tree, source))
+    via_analysis = tuple(rule.check_analysis(analysis_mod.Analysis(tree), source))
+    assert sorted(via_analysis, key=_position) == sorted(result, key=_position)
+    return result
+
+
+# The first ast.parse in a process pays one-off lazy-import setup; warm it at
+# import so the first test and --durations numbers show steady-state cost.
+parse("")
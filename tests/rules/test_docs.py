@@ -1,14 +1,13 @@
 """Tests for DOC001 documentation rules."""
 
-import ast
-import textwrap
-
 from sergey.rules import docs
+from tests.rules._ast_cache import diags as _diags
+
+_DOC001 = docs.DOC001()
 
 
 def _check_doc001(source: str) -> list[str]:
-    tree = ast.parse(textwrap.dedent(source))
-    return [diag.rule_id for diag in docs.DOC001().check(tree, source)]
+    return [diag.rule_id for diag in _diags(_DOC001, source)]
 
 
 class TestDOC001:
@@ -266,35 +265,32 @@ class TestDOC001:
     # ------------------------------------------------------------------
 
     def test_rule_id(self) -> None:
-        source = textwrap.dedent('''\
+        source = '''\
             def foo():
                 """Summary."""
                 raise ValueError("x")
-        ''')
-        tree = ast.parse(source)
-        diags = docs.DOC001().check(tree, source)
+        '''
+        diags = _diags(_DOC001, source)
         assert diags[0].rule_id == "DOC001"
 
     def test_diagnostic_points_to_def_line(self) -> None:
-        source = textwrap.dedent('''\
+        source = '''\
             x = 1
             def foo():
                 """Summary."""
                 raise ValueError("x")
-        ''')
-        tree = ast.parse(source)
-        diags = docs.DOC001().check(tree, source)
+        '''
+        diags = _diags(_DOC001, source)
         assert len(diags) == 1
         assert diags[0].line == 2
 
     def test_diagnostic_message_contains_function_name(self) -> None:
-        source = textwrap.dedent('''\
+        source = '''\
             def parse(text):
                 """Parse."""
                 raise ValueError("bad")
-        ''')
-        tree = ast.parse(source)
-        diags = docs.DOC001().check(tree, source)
+        '''
+        diags = _diags(_DOC001, source)
         assert "`parse`" in diags[0].message
         assert "Raises" in diags[0].message
 
@@ -455,7 +451,7 @@ class TestDOC001:
     # ------------------------------------------------------------------
 
     def test_missing_exception_diagnostic_points_to_raise(self) -> None:
-        source = textwrap.dedent('''\
+        source = '''\
             def foo():
                 """Summary.
 
@@ -463,14 +459,13 @@ class TestDOC001:
                     RuntimeError: Something.
                 """
                 raise ValueError("x")
-        ''')
-        tree = ast.parse(source)
-        diags = docs.DOC001().check(tree, source)
+        '''
+        diags = _diags(_DOC001, source)
         assert len(diags) == 1
         assert diags[0].line == 7  # the raise statement
 
     def test_missing_exception_message_mentions_exception_name(self) -> None:
-        source = textwrap.dedent('''\
+        source = '''\
             def foo():
                 """Summary.
 
@@ -478,13 +473,12 @@ class TestDOC001:
                     RuntimeError: Something.
                 """
                 raise ValueError("x")
-        ''')
-        tree = ast.parse(source)
-        diags = docs.DOC001().check(tree, source)
+        '''
+        diags = _diags(_DOC001, source)
         assert "`ValueError`" in diags[0].message
 
     def test_missing_exception_message_mentions_function_name(self) -> None:
-        source = textwrap.dedent('''\
+        source = '''\
             def parse(text):
                 """Parse.
 
@@ -492,7 +486,6 @@ class TestDOC001:
                     RuntimeError: Something.
                 """
                 raise ValueError("x")
-        ''')
-        tree = ast.parse(source)
-        diags = docs.DOC001().check(tree, source)
+        '''
+        diags = _diags(_DOC001, source)
         assert "`parse`" in diags[0].message
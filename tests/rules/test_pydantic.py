@@ -1,14 +1,17 @@
 """Tests for PDT001, PDT002, and PDT003 Pydantic rules."""
 
-import ast
-import textwrap
-
 from sergey.rules import pydantic
+from tests.rules._ast_cache import diags as _diags
+
+# The rules keep no per-check state, so one shared instance per rule avoids
+# re-running construction for every test.
+_PDT001 = pydantic.PDT001()
+_PDT002 = pydantic.PDT002()
+_PDT003 = pydantic.PDT003()
 
 
 def _check_pdt001(source: str) -> list[str]:
-    tree = ast.parse(textwrap.dedent(source))
-    return [diag.rule_id for diag in pydantic.PDT001().check(tree, source)]
+    return [diag.rule_id for diag in _diags(_PDT001, source)]
 
 
 class TestPDT001:
@@ -31,52 +34,52 @@ class TestPDT001:
 
     def test_frozen_true_ok(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                name: str
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    name: str
+"""
         assert _check_pdt001(source) == []
 
     def test_frozen_false_ok(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str
+"""
         assert _check_pdt001(source) == []
 
     def test_frozen_with_other_kwargs_ok(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True, validate_assignment=True)
-                name: str
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True, validate_assignment=True)
+    name: str
+"""
         assert _check_pdt001(source) == []
 
     def test_qualified_basemodel_ok(self) -> None:
         # pydantic.BaseModel via attribute access
         source = """\
-            class User(pydantic.BaseModel):
-                model_config = ConfigDict(frozen=True)
-                name: str
-        """
+class User(pydantic.BaseModel):
+    model_config = ConfigDict(frozen=True)
+    name: str
+"""
         assert _check_pdt001(source) == []
 
     def test_qualified_config_dict_ok(self) -> None:
         # pydantic.ConfigDict via attribute access
         source = """\
-            class User(BaseModel):
-                model_config = pydantic.ConfigDict(frozen=True)
-                name: str
-        """
+class User(BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True)
+    name: str
+"""
         assert _check_pdt001(source) == []
 
     def test_annotated_assignment_ok(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
-                name: str
-        """
+class User(BaseModel):
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+    name: str
+"""
         assert _check_pdt001(source) == []
 
     # ------------------------------------------------------------------
@@ -85,9 +88,9 @@ class TestPDT001:
 
     def test_no_model_config_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                name: str
-        """
+class User(BaseModel):
+    name: str
+"""
         assert _check_pdt001(source) == ["PDT001"]
 
     def test_no_model_config_empty_body_flagged(self) -> None:
@@ -96,10 +99,10 @@ class TestPDT001:
     def test_annotated_no_value_flagged(self) -> None:
         # Declared but never assigned — treated as absent.
         source = """\
-            class User(BaseModel):
-                model_config: ClassVar[ConfigDict]
-                name: str
-        """
+class User(BaseModel):
+    model_config: ClassVar[ConfigDict]
+    name: str
+"""
         assert _check_pdt001(source) == ["PDT001"]
 
     # ------------------------------------------------------------------
@@ -108,18 +111,18 @@ class TestPDT001:
 
     def test_model_config_not_a_call_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = {"frozen": True}
-                name: str
-        """
+class User(BaseModel):
+    model_config = {"frozen": True}
+    name: str
+"""
         assert _check_pdt001(source) == ["PDT001"]
 
     def test_model_config_bare_variable_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = MY_CONFIG
-                name: str
-        """
+class User(BaseModel):
+    model_config = MY_CONFIG
+    name: str
+"""
         assert _check_pdt001(source) == ["PDT001"]
 
     # ------------------------------------------------------------------
@@ -128,18 +131,18 @@ class TestPDT001:
 
     def test_empty_config_dict_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict()
-                name: str
-        """
+class User(BaseModel):
+    model_config = ConfigDict()
+    name: str
+"""
         assert _check_pdt001(source) == ["PDT001"]
 
     def test_config_dict_without_frozen_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(validate_assignment=True)
-                name: str
-        """
+class User(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+    name: str
+"""
         assert _check_pdt001(source) == ["PDT001"]
 
     # ------------------------------------------------------------------
@@ -148,34 +151,34 @@ class TestPDT001:
 
     def test_two_bad_models_two_diagnostics(self) -> None:
         source = """\
-            class User(BaseModel):
-                name: str
+class User(BaseModel):
+    name: str
 
-            class Item(BaseModel):
-                title: str
-        """
+class Item(BaseModel):
+    title: str
+"""
         assert _check_pdt001(source) == ["PDT001", "PDT001"]
 
     def test_one_good_one_bad(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                name: str
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    name: str
 
-            class Item(BaseModel):
-                title: str
-        """
+class Item(BaseModel):
+    title: str
+"""
         assert _check_pdt001(source) == ["PDT001"]
 
     def test_non_pydantic_class_among_models_not_flagged(self) -> None:
         source = """\
-            class Helper:
-                pass
+class Helper:
+    pass
 
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                name: str
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    name: str
+"""
         assert _check_pdt001(source) == []
 
     # ------------------------------------------------------------------
@@ -184,52 +187,46 @@ class TestPDT001:
 
     def test_rule_id(self) -> None:
         source = "class User(BaseModel): pass"
-        tree = ast.parse(source)
-        diags = pydantic.PDT001().check(tree, source)
+        diags = _diags(_PDT001, source)
         assert diags[0].rule_id == "PDT001"
 
     def test_no_config_diagnostic_points_to_class(self) -> None:
-        source = textwrap.dedent("""\
-            x = 1
-            class User(BaseModel):
-                name: str
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT001().check(tree, source)
+        source = """\
+x = 1
+class User(BaseModel):
+    name: str
+"""
+        diags = _diags(_PDT001, source)
         assert len(diags) == 1
         assert diags[0].line == 2
 
     def test_missing_frozen_diagnostic_points_to_config_dict(self) -> None:
-        source = textwrap.dedent("""\
-            class User(BaseModel):
-                model_config = ConfigDict()
-                name: str
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT001().check(tree, source)
+        source = """\
+class User(BaseModel):
+    model_config = ConfigDict()
+    name: str
+"""
+        diags = _diags(_PDT001, source)
         assert len(diags) == 1
         assert diags[0].line == 2  # the ConfigDict() line
 
     def test_no_config_message_mentions_model_name(self) -> None:
         source = "class User(BaseModel): pass"
-        tree = ast.parse(source)
-        diags = pydantic.PDT001().check(tree, source)
+        diags = _diags(_PDT001, source)
         assert "`User`" in diags[0].message
 
     def test_missing_frozen_message_mentions_frozen(self) -> None:
-        source = textwrap.dedent("""\
-            class User(BaseModel):
-                model_config = ConfigDict()
-                name: str
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT001().check(tree, source)
+        source = """\
+class User(BaseModel):
+    model_config = ConfigDict()
+    name: str
+"""
+        diags = _diags(_PDT001, source)
         assert "frozen" in diags[0].message
 
 
 def _check_pdt002(source: str) -> list[str]:
-    tree = ast.parse(textwrap.dedent(source))
-    return [diag.rule_id for diag in pydantic.PDT002().check(tree, source)]
+    return [diag.rule_id for diag in _diags(_PDT002, source)]
 
 
 class TestPDT002:
@@ -239,32 +236,32 @@ class TestPDT002:
 
     def test_no_model_config_not_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                tags: list[str]
-        """
+class User(BaseModel):
+    tags: list[str]
+"""
         assert _check_pdt002(source) == []
 
     def test_frozen_false_not_flagged(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                tags: list[str]
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    tags: list[str]
+"""
         assert _check_pdt002(source) == []
 
     def test_frozen_kwarg_missing_not_flagged(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict()
-                tags: list[str]
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict()
+    tags: list[str]
+"""
         assert _check_pdt002(source) == []
 
     def test_non_pydantic_class_not_flagged(self) -> None:
         source = """\
-            class Helper:
-                tags: list[str]
-        """
+class Helper:
+    tags: list[str]
+"""
         assert _check_pdt002(source) == []
 
     # ------------------------------------------------------------------
@@ -273,54 +270,54 @@ class TestPDT002:
 
     def test_primitive_fields_ok(self) -> None:
         source = """\
-            class Point(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                x: float
-                y: float
-                label: str
-        """
+class Point(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    x: float
+    y: float
+    label: str
+"""
         assert _check_pdt002(source) == []
 
     def test_tuple_field_ok(self) -> None:
         source = """\
-            class Point(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                coords: tuple[float, float]
-        """
+class Point(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    coords: tuple[float, float]
+"""
         assert _check_pdt002(source) == []
 
     def test_frozenset_field_ok(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                roles: frozenset[str]
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    roles: frozenset[str]
+"""
         assert _check_pdt002(source) == []
 
     def test_optional_str_ok(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                name: str | None
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    name: str | None
+"""
         assert _check_pdt002(source) == []
 
     def test_class_var_list_ok(self) -> None:
         # ClassVar fields are not model fields — should not be flagged
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                registry: ClassVar[list[str]] = []
-                name: str
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    registry: ClassVar[list[str]] = []
+    name: str
+"""
         assert _check_pdt002(source) == []
 
     def test_qualified_class_var_ok(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                registry: typing.ClassVar[list[str]] = []
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    registry: typing.ClassVar[list[str]] = []
+"""
         assert _check_pdt002(source) == []
 
     # ------------------------------------------------------------------
@@ -329,84 +326,84 @@ class TestPDT002:
 
     def test_list_field_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                tags: list[str]
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    tags: list[str]
+"""
         assert _check_pdt002(source) == ["PDT002"]
 
     def test_dict_field_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                meta: dict[str, int]
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    meta: dict[str, int]
+"""
         assert _check_pdt002(source) == ["PDT002"]
 
     def test_set_field_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                ids: set[int]
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    ids: set[int]
+"""
         assert _check_pdt002(source) == ["PDT002"]
 
     def test_typing_list_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                tags: List[str]
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    tags: List[str]
+"""
         assert _check_pdt002(source) == ["PDT002"]
 
     def test_typing_dict_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                meta: Dict[str, int]
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    meta: Dict[str, int]
+"""
         assert _check_pdt002(source) == ["PDT002"]
 
     def test_optional_list_flagged(self) -> None:
         # Mutable type nested inside Optional
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                tags: list[str] | None
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    tags: list[str] | None
+"""
         assert _check_pdt002(source) == ["PDT002"]
 
     def test_tuple_containing_list_flagged(self) -> None:
         # Tuple itself is immutable but contains a mutable element
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                data: tuple[str, list[int]]
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    data: tuple[str, list[int]]
+"""
         assert _check_pdt002(source) == ["PDT002"]
 
     def test_deque_field_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                queue: deque[str]
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    queue: deque[str]
+"""
         assert _check_pdt002(source) == ["PDT002"]
 
     def test_bytearray_field_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                buf: bytearray
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    buf: bytearray
+"""
         assert _check_pdt002(source) == ["PDT002"]
 
     def test_mutable_sequence_abc_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                items: MutableSequence[str]
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    items: MutableSequence[str]
+"""
         assert _check_pdt002(source) == ["PDT002"]
 
     # ------------------------------------------------------------------
@@ -415,32 +412,32 @@ class TestPDT002:
 
     def test_two_mutable_fields_two_diagnostics(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                tags: list[str]
-                meta: dict[str, int]
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    tags: list[str]
+    meta: dict[str, int]
+"""
         assert _check_pdt002(source) == ["PDT002", "PDT002"]
 
     def test_one_mutable_one_immutable_one_diagnostic(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                name: str
-                tags: list[str]
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    name: str
+    tags: list[str]
+"""
         assert _check_pdt002(source) == ["PDT002"]
 
     def test_only_frozen_model_flagged_among_two(self) -> None:
         source = """\
-            class Good(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                tags: list[str]
+class Good(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    tags: list[str]
 
-            class Bad(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                tags: list[str]
-        """
+class Bad(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    tags: list[str]
+"""
         assert _check_pdt002(source) == ["PDT002"]
 
     # ------------------------------------------------------------------
@@ -448,60 +445,54 @@ class TestPDT002:
     # ------------------------------------------------------------------
 
     def test_rule_id_is_pdt002(self) -> None:
-        source = textwrap.dedent("""\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                tags: list[str]
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT002().check(tree, source)
+        source = """\
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    tags: list[str]
+"""
+        diags = _diags(_PDT002, source)
         assert diags[0].rule_id == "PDT002"
 
     def test_diagnostic_points_to_annotation(self) -> None:
-        source = textwrap.dedent("""\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                tags: list[str]
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT002().check(tree, source)
+        source = """\
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    tags: list[str]
+"""
+        diags = _diags(_PDT002, source)
         assert len(diags) == 1
         assert diags[0].line == 3  # the annotation line
 
     def test_message_mentions_field_name(self) -> None:
-        source = textwrap.dedent("""\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                tags: list[str]
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT002().check(tree, source)
+        source = """\
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    tags: list[str]
+"""
+        diags = _diags(_PDT002, source)
         assert "`tags`" in diags[0].message
 
     def test_message_mentions_mutable_type(self) -> None:
-        source = textwrap.dedent("""\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                tags: list[str]
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT002().check(tree, source)
+        source = """\
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    tags: list[str]
+"""
+        diags = _diags(_PDT002, source)
         assert "`list`" in diags[0].message
 
     def test_message_mentions_model_name(self) -> None:
-        source = textwrap.dedent("""\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                tags: list[str]
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT002().check(tree, source)
+        source = """\
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    tags: list[str]
+"""
+        diags = _diags(_PDT002, source)
         assert "`User`" in diags[0].message
 
 
 def _check_pdt003(source: str) -> list[str]:
-    tree = ast.parse(textwrap.dedent(source))
-    return [diag.rule_id for diag in pydantic.PDT003().check(tree, source)]
+    return [diag.rule_id for diag in _diags(_PDT003, source)]
 
 
 class TestPDT003:
@@ -514,42 +505,42 @@ class TestPDT003:
 
     def test_non_pydantic_class_not_flagged(self) -> None:
         source = """\
-            class Foo(Bar):
-                body: str
-        """
+class Foo(Bar):
+    body: str
+"""
         assert _check_pdt003(source) == []
 
     def test_frozen_true_model_not_flagged(self) -> None:
         # PDT003 only applies to non-frozen models
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                name: str
-        """
+class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    name: str
+"""
         assert _check_pdt003(source) == []
 
     def test_no_model_config_not_flagged(self) -> None:
         # PDT001 catches this; PDT003 only activates on explicit frozen=False
         source = """\
-            class User(BaseModel):
-                name: str
-        """
+class User(BaseModel):
+    name: str
+"""
         assert _check_pdt003(source) == []
 
     def test_frozen_kwarg_absent_not_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = ConfigDict()
-                name: str
-        """
+class User(BaseModel):
+    model_config = ConfigDict()
+    name: str
+"""
         assert _check_pdt003(source) == []
 
     def test_model_config_not_config_dict_not_flagged(self) -> None:
         source = """\
-            class User(BaseModel):
-                model_config = {"frozen": False}
-                name: str
-        """
+class User(BaseModel):
+    model_config = {"frozen": False}
+    name: str
+"""
         assert _check_pdt003(source) == []
 
     # ------------------------------------------------------------------
@@ -558,85 +549,85 @@ class TestPDT003:
 
     def test_field_frozen_false_ok(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str = Field(frozen=False)
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str = Field(frozen=False)
+"""
         assert _check_pdt003(source) == []
 
     def test_field_frozen_true_ok(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                slug: str = Field(frozen=True)
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    slug: str = Field(frozen=True)
+"""
         assert _check_pdt003(source) == []
 
     def test_annotated_field_frozen_ok(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: Annotated[str, Field(frozen=False)]
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: Annotated[str, Field(frozen=False)]
+"""
         assert _check_pdt003(source) == []
 
     def test_annotated_field_frozen_true_ok(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                slug: Annotated[str, Field(frozen=True)]
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    slug: Annotated[str, Field(frozen=True)]
+"""
         assert _check_pdt003(source) == []
 
     def test_annotated_with_extra_metadata_ok(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: Annotated[str, "description", Field(frozen=False)]
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: Annotated[str, "description", Field(frozen=False)]
+"""
         assert _check_pdt003(source) == []
 
     def test_class_var_not_flagged(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                registry: ClassVar[list[str]] = []
-                body: str = Field(frozen=False)
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    registry: ClassVar[list[str]] = []
+    body: str = Field(frozen=False)
+"""
         assert _check_pdt003(source) == []
 
     def test_model_config_field_not_flagged(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str = Field(frozen=False)
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str = Field(frozen=False)
+"""
         assert _check_pdt003(source) == []
 
     def test_qualified_field_call_ok(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str = pydantic.Field(frozen=False)
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str = pydantic.Field(frozen=False)
+"""
         assert _check_pdt003(source) == []
 
     def test_qualified_config_dict_ok(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = pydantic.ConfigDict(frozen=False)
-                body: str = Field(frozen=False)
-        """
+class Draft(BaseModel):
+    model_config = pydantic.ConfigDict(frozen=False)
+    body: str = Field(frozen=False)
+"""
         assert _check_pdt003(source) == []
 
     def test_multiple_fields_all_declared_ok(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str = Field(frozen=False)
-                slug: str = Field(frozen=True)
-                count: int = Field(frozen=False)
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str = Field(frozen=False)
+    slug: str = Field(frozen=True)
+    count: int = Field(frozen=False)
+"""
         assert _check_pdt003(source) == []
 
     # ------------------------------------------------------------------
@@ -645,56 +636,56 @@ class TestPDT003:
 
     def test_bare_annotation_flagged(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str
+"""
         assert _check_pdt003(source) == ["PDT003"]
 
     def test_field_without_frozen_kwarg_flagged(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str = Field(default="")
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str = Field(default="")
+"""
         assert _check_pdt003(source) == ["PDT003"]
 
     def test_annotated_field_without_frozen_flagged(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: Annotated[str, Field(default="")]
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: Annotated[str, Field(default="")]
+"""
         assert _check_pdt003(source) == ["PDT003"]
 
     def test_two_bare_fields_two_diagnostics(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str
-                slug: str
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str
+    slug: str
+"""
         assert _check_pdt003(source) == ["PDT003", "PDT003"]
 
     def test_one_declared_one_missing_one_diagnostic(self) -> None:
         source = """\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str = Field(frozen=False)
-                slug: str
-        """
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str = Field(frozen=False)
+    slug: str
+"""
         assert _check_pdt003(source) == ["PDT003"]
 
     def test_only_non_frozen_model_flagged_among_two(self) -> None:
         source = """\
-            class Good(BaseModel):
-                model_config = ConfigDict(frozen=True)
-                name: str
+class Good(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    name: str
 
-            class Bad(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                name: str
-        """
+class Bad(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    name: str
+"""
         assert _check_pdt003(source) == ["PDT003"]
 
     # ------------------------------------------------------------------
@@ -702,52 +693,47 @@ class TestPDT003:
     # ------------------------------------------------------------------
 
     def test_rule_id_is_pdt003(self) -> None:
-        source = textwrap.dedent("""\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT003().check(tree, source)
+        source = """\
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str
+"""
+        diags = _diags(_PDT003, source)
         assert diags[0].rule_id == "PDT003"
 
     def test_diagnostic_points_to_annotation(self) -> None:
-        source = textwrap.dedent("""\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT003().check(tree, source)
+        source = """\
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str
+"""
+        diags = _diags(_PDT003, source)
         assert len(diags) == 1
         assert diags[0].line == 3
 
     def test_message_mentions_field_name(self) -> None:
-        source = textwrap.dedent("""\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT003().check(tree, source)
+        source = """\
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str
+"""
+        diags = _diags(_PDT003, source)
         assert "`body`" in diags[0].message
 
     def test_message_mentions_model_name(self) -> None:
-        source = textwrap.dedent("""\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT003().check(tree, source)
+        source = """\
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str
+"""
+        diags = _diags(_PDT003, source)
         assert "`Draft`" in diags[0].message
 
     def test_message_mentions_frozen(self) -> None:
-        source = textwrap.dedent("""\
-            class Draft(BaseModel):
-                model_config = ConfigDict(frozen=False)
-                body: str
-        """)
-        tree = ast.parse(source)
-        diags = pydantic.PDT003().check(tree, source)
+        source = """\
+class Draft(BaseModel):
+    model_config = ConfigDict(frozen=False)
+    body: str
+"""
+        diags = _diags(_PDT003, source)
         assert "frozen" in diags[0].message
@@ -1,25 +1,45 @@
 """Tests for STR002, STR003, STR004, STR005, STR006, and STR007 structure rules."""
 
-import ast
-import textwrap
+import pytest
 
 from sergey.rules import structure
+from tests.rules._ast_cache import diags as _diags
+from tests.rules._ast_cache import parse as _parse
+
+# The rules keep no per-check state, so one shared instance per rule avoids
+# re-running construction for every test.
+_STR002 = structure.STR002()
+_STR003 = structure.STR003()
+_STR004 = structure.STR004()
+_STR005 = structure.STR005()
+_STR006 = structure.STR006()
+_STR007 = structure.STR007()
 
 
 def _check_str002(source: str) -> list[str]:
-    tree = ast.parse(textwrap.dedent(source))
-    return [diag.rule_id for diag in structure.STR002().check(tree, source)]
+    return [diag.rule_id for diag in _diags(_STR002, source)]
 
 
 def _check_str003(source: str, **kwargs: int) -> list[str]:
-    tree = ast.parse(textwrap.dedent(source))
-    return [diag.rule_id for diag in structure.STR003(**kwargs).check(tree, source)]
+    rule = structure.STR003(**kwargs) if kwargs else _STR003
+    return [diag.rule_id for diag in _diags(rule, source)]
 
 
 # ---------------------------------------------------------------------------
 # STR002 — maximum nesting depth
 # ---------------------------------------------------------------------------
 
+# Shared depth-4 skeleton for the flagged cases: any nesting statement
+# appended below the innermost `for` sits at depth 5.
+_DEPTH4_SYNC = """\
+def foo():
+    for a in x:
+        for b in y:
+            for c in z:
+                for d in w:
+"""
+_DEPTH4_ASYNC = "async " + _DEPTH4_SYNC
+
 
 class TestSTR002:
     # ------------------------------------------------------------------
@@ -27,218 +47,184 @@ class TestSTR002:
     # ------------------------------------------------------------------
 
     def test_depth_zero_ok(self) -> None:
-        assert _check_str002("x = 1") == []
+        assert not _check_str002("x = 1")
 
     def test_depth_one_ok(self) -> None:
-        assert _check_str002("for item in items: pass") == []
+        assert not _check_str002("for item in items: pass")
 
     def test_depth_four_ok(self) -> None:
         source = """\
-            def foo():
-                for a in x:
-                    for b in y:
-                        if c:
-                            with ctx:
-                                pass
-        """
-        assert _check_str002(source) == []
+def foo():
+    for a in x:
+        for b in y:
+            if c:
+                with ctx:
+                    pass
+"""
+        assert not _check_str002(source)
 
     def test_elif_does_not_add_depth(self) -> None:
         # if/elif/else is one level; the elif should NOT push depth to 5.
         source = """\
-            def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            if case1:
-                                pass
-                            elif case2:
-                                pass
-                            else:
-                                pass
-        """
-        assert _check_str002(source) == []
+def foo():
+    for a in x:
+        for b in y:
+            for c in z:
+                if case1:
+                    pass
+                elif case2:
+                    pass
+                else:
+                    pass
+"""
+        assert not _check_str002(source)
 
     def test_nested_function_resets_depth(self) -> None:
         # Outer code is at depth 4; inner function resets to 0.
         source = """\
-            def outer():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                def inner():
-                                    if flag:
-                                        pass
-        """
-        assert _check_str002(source) == []
+def outer():
+    for a in x:
+        for b in y:
+            for c in z:
+                for d in w:
+                    def inner():
+                        if flag:
+                            pass
+"""
+        assert not _check_str002(source)
 
     def test_class_resets_depth(self) -> None:
         source = """\
-            for a in x:
-                for b in y:
-                    for c in z:
-                        for d in w:
-                            class Inner:
-                                if True:
-                                    pass
-        """
-        assert _check_str002(source) == []
+for a in x:
+    for b in y:
+        for c in z:
+            for d in w:
+                class Inner:
+                    if True:
+                        pass
+"""
+        assert not _check_str002(source)
 
     def test_lambda_resets_depth(self) -> None:
         # The lambda body is a fresh scope.
         source = """\
-            def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                fn = lambda: 1
-        """
-        assert _check_str002(source) == []
+def foo():
+    for a in x:
+        for b in y:
+            for c in z:
+                for d in w:
+                    fn = lambda: 1
+"""
+        assert not _check_str002(source)
 
     def test_while_loop_at_depth_four_ok(self) -> None:
         source = """\
-            def foo():
-                for a in x:
-                    for b in y:
-                        if c:
-                            while running:
-                                pass
-        """
-        assert _check_str002(source) == []
+def foo():
+    for a in x:
+        for b in y:
+            if c:
+                while running:
+                    pass
+"""
+        assert not _check_str002(source)
 
     def test_try_at_depth_four_ok(self) -> None:
         source = """\
-            def foo():
-                for a in x:
-                    for b in y:
-                        if c:
-                            try:
-                                pass
-                            except Exception:
-                                pass
-        """
-        assert _check_str002(source) == []
+def foo():
+    for a in x:
+        for b in y:
+            if c:
+                try:
+                    pass
+                except Exception:
+                    pass
+"""
+        assert not _check_str002(source)
 
     # ------------------------------------------------------------------
     # Over-limit cases (diagnostic expected)
     # ------------------------------------------------------------------
 
-    def test_depth_five_flagged(self) -> None:
-        source = """\
-            def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                if flag:
-                                    pass
-        """
+    @pytest.mark.parametrize(
+        "source",
+        [
+            pytest.param(
+                _DEPTH4_SYNC + "                    if flag:\n"
+                "                        pass\n",
+                id="if",
+            ),
+            pytest.param(
+                _DEPTH4_SYNC + "                    while running:\n"
+                "                        pass\n",
+                id="while",
+            ),
+            pytest.param(
+                _DEPTH4_SYNC + "                    with ctx:\n"
+                "                        pass\n",
+                id="with",
+            ),
+            pytest.param(
+                _DEPTH4_SYNC + "                    try:\n"
+                "                        pass\n"
+                "                    except Exception:\n"
+                "                        pass\n",
+                id="try",
+            ),
+            pytest.param(
+                _DEPTH4_ASYNC + "                    async for e in stream:\n"
+                "                        pass\n",
+                id="async_for",
+            ),
+            pytest.param(
+                _DEPTH4_ASYNC + "                    async with lock:\n"
+                "                        pass\n",
+                id="async_with",
+            ),
+        ],
+    )
+    def test_depth_five_flagged(self, source: str) -> None:
         assert _check_str002(source) == ["STR002"]
 
     def test_depth_five_module_level_flagged(self) -> None:
         # Nesting at module level is also counted.
         source = """\
-            for a in x:
-                for b in y:
-                    for c in z:
-                        for d in w:
-                            if flag:
-                                pass
-        """
+for a in x:
+    for b in y:
+        for c in z:
+            for d in w:
+                if flag:
+                    pass
+"""
         assert _check_str002(source) == ["STR002"]
 
     def test_two_sibling_violations_two_diagnostics(self) -> None:
         # Two separate depth-5 blocks in the same function → two diagnostics.
         source = """\
-            def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                if flag1:
-                                    pass
-                                if flag2:
-                                    pass
-        """
+def foo():
+    for a in x:
+        for b in y:
+            for c in z:
+                for d in w:
+                    if flag1:
+                        pass
+                    if flag2:
+                        pass
+"""
         assert _check_str002(source) == ["STR002", "STR002"]
 
     def test_elif_at_depth_five_not_double_counted(self) -> None:
         # The if/elif at depth 5 emits only ONE diagnostic (for the `if`).
         source = """\
-            def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                if case1:
-                                    pass
-                                elif case2:
-                                    pass
-        """
-        assert _check_str002(source) == ["STR002"]
-
-    def test_while_at_depth_five_flagged(self) -> None:
-        source = """\
-            def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                while running:
-                                    pass
-        """
-        assert _check_str002(source) == ["STR002"]
-
-    def test_with_at_depth_five_flagged(self) -> None:
-        source = """\
-            def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                with ctx:
-                                    pass
-        """
-        assert _check_str002(source) == ["STR002"]
-
-    def test_try_at_depth_five_flagged(self) -> None:
-        source = """\
-            def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                try:
-                                    pass
-                                except Exception:
-                                    pass
-        """
-        assert _check_str002(source) == ["STR002"]
-
-    def test_async_for_flagged(self) -> None:
-        source = """\
-            async def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                async for e in stream:
-                                    pass
-        """
-        assert _check_str002(source) == ["STR002"]
-
-    def test_async_with_flagged(self) -> None:
-        source = """\
-            async def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                async with lock:
-                                    pass
-        """
+def foo():
+    for a in x:
+        for b in y:
+            for c in z:
+                for d in w:
+                    if case1:
+                        pass
+                    elif case2:
+                        pass
+"""
         assert _check_str002(source) == ["STR002"]
 
     # ------------------------------------------------------------------
@@ -246,47 +232,44 @@ class TestSTR002:
     # ------------------------------------------------------------------
 
     def test_diagnostic_rule_id(self) -> None:
-        source = textwrap.dedent("""\
-            def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                if flag:
-                                    pass
-        """)
-        tree = ast.parse(source)
-        diags = structure.STR002().check(tree, source)
+        source = """\
+def foo():
+    for a in x:
+        for b in y:
+            for c in z:
+                for d in w:
+                    if flag:
+                        pass
+"""
+        diags = _diags(_STR002, source)
         assert len(diags) == 1
         assert diags[0].rule_id == "STR002"
 
     def test_diagnostic_line_points_to_offending_block(self) -> None:
-        source = textwrap.dedent("""\
-            def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                if flag:
-                                    pass
-        """)
-        tree = ast.parse(source)
-        diags = structure.STR002().check(tree, source)
+        source = """\
+def foo():
+    for a in x:
+        for b in y:
+            for c in z:
+                for d in w:
+                    if flag:
+                        pass
+"""
+        diags = _diags(_STR002, source)
         assert len(diags) == 1
         assert diags[0].line == 6  # the `if flag:` line
 
     def test_diagnostic_message_contains_depth(self) -> None:
-        source = textwrap.dedent("""\
-            def foo():
-                for a in x:
-                    for b in y:
-                        for c in z:
-                            for d in w:
-                                if flag:
-                                    pass
-        """)
-        tree = ast.parse(source)
-        diags = structure.STR002().check(tree, source)
+        source = """\
+def foo():
+    for a in x:
+        for b in y:
+            for c in z:
+                for d in w:
+                    if flag:
+                        pass
+"""
+        diags = _diags(_STR002, source)
         assert "5" in diags[0].message
         assert "4" in diags[0].message  # mentions the maximum too
 
@@ -302,59 +285,59 @@ class TestSTR003:
     # ------------------------------------------------------------------
 
     def test_empty_try_ok(self) -> None:
-        assert _check_str003("try:\n    pass\nexcept Exception:\n    pass") == []
+        assert not _check_str003("try:\n    pass\nexcept Exception:\n    pass")
 
     def test_four_stmts_ok(self) -> None:
         source = """\
-            try:
-                a = 1
-                b = 2
-                c = 3
-                d = 4
-            except Exception:
-                pass
-        """
-        assert _check_str003(source) == []
+try:
+    a = 1
+    b = 2
+    c = 3
+    d = 4
+except Exception:
+    pass
+"""
+        assert not _check_str003(source)
 
     def test_long_except_not_flagged(self) -> None:
         # except block length is irrelevant — only the try body counts
         source = """\
-            try:
-                result = fetch()
-            except Exception:
-                a = 1
-                b = 2
-                c = 3
-                d = 4
-                e = 5
-                f = 6
-        """
-        assert _check_str003(source) == []
+try:
+    result = fetch()
+except Exception:
+    a = 1
+    b = 2
+    c = 3
+    d = 4
+    e = 5
+    f = 6
+"""
+        assert not _check_str003(source)
 
     def test_long_finally_not_flagged(self) -> None:
         source = """\
-            try:
-                result = fetch()
-            except Exception:
-                pass
-            finally:
-                a = 1
-                b = 2
-                c = 3
-                d = 4
-                e = 5
-        """
-        assert _check_str003(source) == []
+try:
+    result = fetch()
+except Exception:
+    pass
+finally:
+    a = 1
+    b = 2
+    c = 3
+    d = 4
+    e = 5
+"""
+        assert not _check_str003(source)
 
     def test_custom_threshold_below_ok(self) -> None:
         source = """\
-            try:
-                a = 1
-                b = 2
-            except Exception:
-                pass
-        """
-        assert _check_str003(source, max_body_stmts=2) == []
+try:
+    a = 1
+    b = 2
+except Exception:
+    pass
+"""
+        assert not _check_str003(source, max_body_stmts=2)
 
     # ------------------------------------------------------------------
     # Over-limit cases (diagnostic expected)
@@ -362,61 +345,61 @@ class TestSTR003:
 
     def test_five_stmts_flagged(self) -> None:
         source = """\
-            try:
-                a = 1
-                b = 2
-                c = 3
-                d = 4
-                e = 5
-            except Exception:
-                pass
-        """
+try:
+    a = 1
+    b = 2
+    c = 3
+    d = 4
+    e = 5
+except Exception:
+    pass
+"""
         assert _check_str003(source) == ["STR003"]
 
     def test_six_stmts_flagged(self) -> None:
         source = """\
-            try:
-                a = 1
-                b = 2
-                c = 3
-                d = 4
-                e = 5
-                f = 6
-            except Exception:
-                pass
-        """
+try:
+    a = 1
+    b = 2
+    c = 3
+    d = 4
+    e = 5
+    f = 6
+except Exception:
+    pass
+"""
         assert _check_str003(source) == ["STR003"]
 
     def test_two_try_blocks_both_long(self) -> None:
         source = """\
-            try:
-                a = 1
-                b = 2
-                c = 3
-                d = 4
-                e = 5
-            except Exception:
-                pass
-            try:
-                a = 1
-                b = 2
-                c = 3
-                d = 4
-                e = 5
-            except Exception:
-                pass
-        """
+try:
+    a = 1
+    b = 2
+    c = 3
+    d = 4
+    e = 5
+except Exception:
+    pass
+try:
+    a = 1
+    b = 2
+    c = 3
+    d = 4
+    e = 5
+except Exception:
+    pass
+"""
         assert _check_str003(source) == ["STR003", "STR003"]
 
     def test_custom_threshold_exceeded(self) -> None:
         source = """\
-            try:
-                a = 1
-                b = 2
-                c = 3
-            except Exception:
-                pass
-        """
+try:
+    a = 1
+    b = 2
+    c = 3
+except Exception:
+    pass
+"""
         assert _check_str003(source, max_body_stmts=2) == ["STR003"]
 
     # ------------------------------------------------------------------
@@ -424,81 +407,78 @@ class TestSTR003:
     # ------------------------------------------------------------------
 
     def test_rule_id(self) -> None:
-        source = textwrap.dedent("""\
-            try:
-                a = 1
-                b = 2
-                c = 3
-                d = 4
-                e = 5
-            except Exception:
-                pass
-        """)
-        tree = ast.parse(source)
-        diags = structure.STR003().check(tree, source)
+        source = """\
+try:
+    a = 1
+    b = 2
+    c = 3
+    d = 4
+    e = 5
+except Exception:
+    pass
+"""
+        diags = _diags(_STR003, source)
         assert diags[0].rule_id == "STR003"
 
     def test_diagnostic_line_points_to_try(self) -> None:
-        source = textwrap.dedent("""\
-            x = 0
-            try:
-                a = 1
-                b = 2
-                c = 3
-                d = 4
-                e = 5
-            except Exception:
-                pass
-        """)
-        tree = ast.parse(source)
-        diags = structure.STR003().check(tree, source)
+        source = """\
+x = 0
+try:
+    a = 1
+    b = 2
+    c = 3
+    d = 4
+    e = 5
+except Exception:
+    pass
+"""
+        diags = _diags(_STR003, source)
         assert len(diags) == 1
         assert diags[0].line == 2  # the `try:` line
 
     def test_diagnostic_message_contains_counts(self) -> None:
-        source = textwrap.dedent("""\
-            try:
-                a = 1
-                b = 2
-                c = 3
-                d = 4
-                e = 5
-            except Exception:
-                pass
-        """)
-        tree = ast.parse(source)
-        diags = structure.STR003().check(tree, source)
+        source = """\
+try:
+    a = 1
+    b = 2
+    c = 3
+    d = 4
+    e = 5
+except Exception:
+    pass
+"""
+        diags = _diags(_STR003, source)
         assert "5" in diags[0].message  # actual count
         assert "4" in diags[0].message  # maximum allowed
 
     def test_configure_changes_threshold(self) -> None:
         rule = structure.STR003()
         configured = rule.configure({"max_body_stmts": 2})
-        source = textwrap.dedent("""\
-            try:
-                a = 1
-                b = 2
-                c = 3
-            except Exception:
-                pass
-        """)
-        tree = ast.parse(source)
+        source = """\
+try:
+    a = 1
+    b = 2
+    c = 3
+except Exception:
+    pass
+"""
+        tree = _parse(source)
         assert len(configured.check(tree, source)) == 1
 
     def test_configure_unknown_option_returns_same_behaviour(self) -> None:
         rule = structure.STR003()
         configured = rule.configure({"unknown_option": 99})
-        source = textwrap.dedent("""\
-            try:
-                a = 1
-                b = 2
-                c = 3
-                d = 4
-                e = 5
-            except Exception:
-                pass
-        """)
-        tree = ast.parse(source)
+        source = """\
+try:
+    a = 1
+    b = 2
+    c = 3
+    d = 4
+    e = 5
+except Exception:
+    pass
+"""
+        tree = _parse(source)
         assert configured.check(tree, source) == rule.check(tree, source)
 
 
@@ -508,8 +488,7 @@ class TestSTR003:
 
 
 def _check_str004(source: str) -> list[str]:
-    tree = ast.parse(textwrap.dedent(source))
-    return [diag.rule_id for diag in structure.STR004().check(tree, source)]
+    return [diag.rule_id for diag in _diags(_STR004, source)]
 
 
 class TestSTR004:
@@ -519,70 +498,70 @@ class TestSTR004:
 
     def test_unmodified_list_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                for item in items:
-                    print(item)
-        """
+def foo():
+    items = [1, 2, 3]
+    for item in items:
+        print(item)
+"""
         assert _check_str004(source) == ["STR004"]
 
     def test_unused_list_flagged(self) -> None:
         source = """\
-            def foo():
-                items = []
-        """
+def foo():
+    items = []
+"""
         assert _check_str004(source) == ["STR004"]
 
     def test_list_used_for_membership_flagged(self) -> None:
         source = """\
-            def foo(val):
-                allowed = [1, 2, 3]
-                if val in allowed:
-                    pass
-        """
+def foo(val):
+    allowed = [1, 2, 3]
+    if val in allowed:
+        pass
+"""
         assert _check_str004(source) == ["STR004"]
 
     def test_annotated_assignment_flagged(self) -> None:
         source = """\
-            def foo():
-                items: list[int] = [1, 2, 3]
-                print(items)
-        """
+def foo():
+    items: list[int] = [1, 2, 3]
+    print(items)
+"""
         assert _check_str004(source) == ["STR004"]
 
     def test_async_function_flagged(self) -> None:
         source = """\
-            async def foo():
-                items = [1, 2, 3]
-                for item in items:
-                    pass
-        """
+async def foo():
+    items = [1, 2, 3]
+    for item in items:
+        pass
+"""
         assert _check_str004(source) == ["STR004"]
 
     def test_multiple_unmodified_lists_both_flagged(self) -> None:
         source = """\
-            def foo():
-                xs = [1, 2]
-                ys = [3, 4]
-                print(xs, ys)
-        """
+def foo():
+    xs = [1, 2]
+    ys = [3, 4]
+    print(xs, ys)
+"""
         assert _check_str004(source) == ["STR004", "STR004"]
 
     def test_list_in_if_branch_flagged(self) -> None:
         source = """\
-            def foo(cond):
-                if cond:
-                    items = [1, 2, 3]
-                    print(items)
-        """
+def foo(cond):
+    if cond:
+        items = [1, 2, 3]
+        print(items)
+"""
         assert _check_str004(source) == ["STR004"]
 
     def test_list_passed_to_function_still_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                print(len(items))
-        """
+def foo():
+    items = [1, 2, 3]
+    print(len(items))
+"""
         assert _check_str004(source) == ["STR004"]
 
     # ------------------------------------------------------------------
@@ -591,91 +570,91 @@ class TestSTR004:
 
     def test_append_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = []
-                items.append(1)
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = []
+    items.append(1)
+"""
+        assert not _check_str004(source)
 
     def test_extend_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = []
-                items.extend([1, 2])
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = []
+    items.extend([1, 2])
+"""
+        assert not _check_str004(source)
 
     def test_insert_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2]
-                items.insert(0, 0)
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2]
+    items.insert(0, 0)
+"""
+        assert not _check_str004(source)
 
     def test_pop_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2]
-                items.pop()
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2]
+    items.pop()
+"""
+        assert not _check_str004(source)
 
     def test_remove_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                items.remove(2)
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    items.remove(2)
+"""
+        assert not _check_str004(source)
 
     def test_clear_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2]
-                items.clear()
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2]
+    items.clear()
+"""
+        assert not _check_str004(source)
 
     def test_sort_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [3, 1, 2]
-                items.sort()
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [3, 1, 2]
+    items.sort()
+"""
+        assert not _check_str004(source)
 
     def test_reverse_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                items.reverse()
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    items.reverse()
+"""
+        assert not _check_str004(source)
 
     def test_augmented_assignment_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1]
-                items += [2, 3]
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1]
+    items += [2, 3]
+"""
+        assert not _check_str004(source)
 
     def test_subscript_assignment_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                items[0] = 99
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    items[0] = 99
+"""
+        assert not _check_str004(source)
 
     def test_subscript_deletion_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                del items[0]
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    del items[0]
+"""
+        assert not _check_str004(source)
 
     # ------------------------------------------------------------------
     # Cases that should NOT be flagged — function output
@@ -683,35 +662,35 @@ class TestSTR004:
 
     def test_returned_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                return items
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    return items
+"""
+        assert not _check_str004(source)
 
     def test_returned_in_tuple_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                return items, 42
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    return items, 42
+"""
+        assert not _check_str004(source)
 
     def test_yielded_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                yield items
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    yield items
+"""
+        assert not _check_str004(source)
 
     def test_yield_from_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                yield from items
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    yield from items
+"""
+        assert not _check_str004(source)
 
     # ------------------------------------------------------------------
     # Cases that should NOT be flagged — scope / rebinding / escape
@@ -719,139 +698,136 @@ class TestSTR004:
 
     def test_module_level_list_not_flagged(self) -> None:
         source = """\
-            items = [1, 2, 3]
-            for item in items:
-                print(item)
-        """
-        assert _check_str004(source) == []
+items = [1, 2, 3]
+for item in items:
+    print(item)
+"""
+        assert not _check_str004(source)
 
     def test_class_body_list_not_flagged(self) -> None:
         source = """\
-            class Foo:
-                items = [1, 2, 3]
-        """
-        assert _check_str004(source) == []
+class Foo:
+    items = [1, 2, 3]
+"""
+        assert not _check_str004(source)
 
     def test_reassigned_variable_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                items = other()
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    items = other()
+"""
+        assert not _check_str004(source)
 
     def test_global_variable_not_flagged(self) -> None:
         source = """\
-            def foo():
-                global items
-                items = [1, 2, 3]
-        """
-        assert _check_str004(source) == []
+def foo():
+    global items
+    items = [1, 2, 3]
+"""
+        assert not _check_str004(source)
 
     def test_nonlocal_variable_not_flagged(self) -> None:
         source = """\
-            def outer():
-                items = []
-                def foo():
-                    nonlocal items
-                    items = [1, 2, 3]
-        """
-        assert _check_str004(source) == []
+def outer():
+    items = []
+    def foo():
+        nonlocal items
+        items = [1, 2, 3]
+"""
+        assert not _check_str004(source)
 
     def test_used_in_nested_function_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                def inner():
-                    print(items)
-                inner()
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    def inner():
+        print(items)
+    inner()
+"""
+        assert not _check_str004(source)
 
     def test_used_in_lambda_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                fn = lambda: items
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    fn = lambda: items
+"""
+        assert not _check_str004(source)
 
     def test_stored_as_attribute_not_flagged(self) -> None:
         source = """\
-            def foo(self):
-                items = [1, 2, 3]
-                self.items = items
-        """
-        assert _check_str004(source) == []
+def foo(self):
+    items = [1, 2, 3]
+    self.items = items
+"""
+        assert not _check_str004(source)
 
     def test_stored_in_dict_not_flagged(self) -> None:
         source = """\
-            def foo(data):
-                items = [1, 2, 3]
-                data["key"] = items
-        """
-        assert _check_str004(source) == []
+def foo(data):
+    items = [1, 2, 3]
+    data["key"] = items
+"""
+        assert not _check_str004(source)
 
     def test_multi_target_assignment_not_flagged(self) -> None:
         source = """\
-            def foo():
-                x = y = [1, 2, 3]
-        """
-        assert _check_str004(source) == []
+def foo():
+    x = y = [1, 2, 3]
+"""
+        assert not _check_str004(source)
 
     def test_for_loop_rebind_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                for items in something:
-                    pass
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    for items in something:
+        pass
+"""
+        assert not _check_str004(source)
 
     def test_walrus_rebind_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = [1, 2, 3]
-                if (items := other()):
-                    pass
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = [1, 2, 3]
+    if (items := other()):
+        pass
+"""
+        assert not _check_str004(source)
 
     # ------------------------------------------------------------------
     # Diagnostic metadata
     # ------------------------------------------------------------------
 
     def test_rule_id(self) -> None:
-        source = textwrap.dedent("""\
-            def foo():
-                items = [1, 2, 3]
-                print(items)
-        """)
-        tree = ast.parse(source)
-        diags = structure.STR004().check(tree, source)
+        source = """\
+def foo():
+    items = [1, 2, 3]
+    print(items)
+"""
+        diags = _diags(_STR004, source)
         assert len(diags) == 1
         assert diags[0].rule_id == "STR004"
 
     def test_diagnostic_line_points_to_assignment(self) -> None:
-        source = textwrap.dedent("""\
-            def foo():
-                x = 0
-                items = [1, 2, 3]
-                print(items)
-        """)
-        tree = ast.parse(source)
-        diags = structure.STR004().check(tree, source)
+        source = """\
+def foo():
+    x = 0
+    items = [1, 2, 3]
+    print(items)
+"""
+        diags = _diags(_STR004, source)
         assert len(diags) == 1
         assert diags[0].line == 3
 
     def test_diagnostic_message_contains_variable_name(self) -> None:
-        source = textwrap.dedent("""\
-            def foo():
-                colors = ["red", "green"]
-                print(colors)
-        """)
-        tree = ast.parse(source)
-        diags = structure.STR004().check(tree, source)
+        source = """\
+def foo():
+    colors = ["red", "green"]
+    print(colors)
+"""
+        diags = _diags(_STR004, source)
         assert len(diags) == 1
         assert "colors" in diags[0].message
         assert "tuple" in diags[0].message
@@ -862,52 +838,52 @@ class TestSTR004:
 
     def test_unmodified_set_flagged(self) -> None:
         source = """\
-            def foo(val):
-                allowed = {1, 2, 3}
-                if val in allowed:
-                    print("ok")
-        """
+def foo(val):
+    allowed = {1, 2, 3}
+    if val in allowed:
+        print("ok")
+"""
         assert _check_str004(source) == ["STR004"]
 
     def test_unused_set_flagged(self) -> None:
         source = """\
-            def foo():
-                tags = {"a", "b"}
-        """
+def foo():
+    tags = {"a", "b"}
+"""
         assert _check_str004(source) == ["STR004"]
 
     def test_set_iterated_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                for item in items:
-                    print(item)
-        """
+def foo():
+    items = {1, 2, 3}
+    for item in items:
+        print(item)
+"""
         assert _check_str004(source) == ["STR004"]
 
     def test_set_annotated_assignment_flagged(self) -> None:
         source = """\
-            def foo():
-                items: set[int] = {1, 2, 3}
-                print(items)
-        """
+def foo():
+    items: set[int] = {1, 2, 3}
+    print(items)
+"""
         assert _check_str004(source) == ["STR004"]
 
     def test_set_in_async_function_flagged(self) -> None:
         source = """\
-            async def foo():
-                vals = {1, 2}
-                print(vals)
-        """
+async def foo():
+    vals = {1, 2}
+    print(vals)
+"""
         assert _check_str004(source) == ["STR004"]
 
     def test_mixed_list_and_set_both_flagged(self) -> None:
         source = """\
-            def foo():
-                xs = [1, 2]
-                ys = {3, 4}
-                print(xs, ys)
-        """
+def foo():
+    xs = [1, 2]
+    ys = {3, 4}
+    print(xs, ys)
+"""
         assert _check_str004(source) == ["STR004", "STR004"]
 
     # ------------------------------------------------------------------
@@ -916,107 +892,107 @@ class TestSTR004:
 
     def test_set_add_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2}
-                items.add(3)
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2}
+    items.add(3)
+"""
+        assert not _check_str004(source)
 
     def test_set_update_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1}
-                items.update({2, 3})
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1}
+    items.update({2, 3})
+"""
+        assert not _check_str004(source)
 
     def test_set_discard_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                items.discard(2)
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2, 3}
+    items.discard(2)
+"""
+        assert not _check_str004(source)
 
     def test_set_remove_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                items.remove(2)
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2, 3}
+    items.remove(2)
+"""
+        assert not _check_str004(source)
 
     def test_set_pop_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2}
-                items.pop()
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2}
+    items.pop()
+"""
+        assert not _check_str004(source)
 
     def test_set_clear_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2}
-                items.clear()
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2}
+    items.clear()
+"""
+        assert not _check_str004(source)
 
     def test_set_difference_update_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                items.difference_update({1})
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2, 3}
+    items.difference_update({1})
+"""
+        assert not _check_str004(source)
 
     def test_set_intersection_update_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                items.intersection_update({2, 3})
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2, 3}
+    items.intersection_update({2, 3})
+"""
+        assert not _check_str004(source)
 
     def test_set_symmetric_difference_update_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                items.symmetric_difference_update({3, 4})
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2, 3}
+    items.symmetric_difference_update({3, 4})
+"""
+        assert not _check_str004(source)
 
     def test_set_augmented_or_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1}
-                items |= {2, 3}
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1}
+    items |= {2, 3}
+"""
+        assert not _check_str004(source)
 
     def test_set_augmented_and_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                items &= {2, 3}
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2, 3}
+    items &= {2, 3}
+"""
+        assert not _check_str004(source)
 
     def test_set_augmented_sub_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                items -= {1}
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2, 3}
+    items -= {1}
+"""
+        assert not _check_str004(source)
 
     def test_set_augmented_xor_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                items ^= {3, 4}
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2, 3}
+    items ^= {3, 4}
+"""
+        assert not _check_str004(source)
 
     # ------------------------------------------------------------------
     # Set literals — cases that should NOT be flagged (output / escape)
@@ -1024,73 +1000,72 @@ class TestSTR004:
 
     def test_set_returned_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                return items
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2, 3}
+    return items
+"""
+        assert not _check_str004(source)
 
     def test_set_yielded_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                yield items
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2, 3}
+    yield items
+"""
+        assert not _check_str004(source)
 
     def test_set_used_in_nested_function_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                def inner():
-                    print(items)
-                inner()
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2, 3}
+    def inner():
+        print(items)
+    inner()
+"""
+        assert not _check_str004(source)
 
     def test_set_stored_as_attribute_not_flagged(self) -> None:
         source = """\
-            def foo(self):
-                items = {1, 2, 3}
-                self.items = items
-        """
-        assert _check_str004(source) == []
+def foo(self):
+    items = {1, 2, 3}
+    self.items = items
+"""
+        assert not _check_str004(source)
 
     def test_set_reassigned_not_flagged(self) -> None:
         source = """\
-            def foo():
-                items = {1, 2, 3}
-                items = other()
-        """
-        assert _check_str004(source) == []
+def foo():
+    items = {1, 2, 3}
+    items = other()
+"""
+        assert not _check_str004(source)
 
     def test_set_global_not_flagged(self) -> None:
         source = """\
-            def foo():
-                global items
-                items = {1, 2, 3}
-        """
-        assert _check_str004(source) == []
+def foo():
+    global items
+    items = {1, 2, 3}
+"""
+        assert not _check_str004(source)
 
     def test_module_level_set_not_flagged(self) -> None:
         source = """\
-            items = {1, 2, 3}
-            print(items)
-        """
-        assert _check_str004(source) == []
+items = {1, 2, 3}
+print(items)
+"""
+        assert not _check_str004(source)
 
     # ------------------------------------------------------------------
     # Set diagnostic metadata
     # ------------------------------------------------------------------
 
     def test_set_diagnostic_message(self) -> None:
-        source = textwrap.dedent("""\
-            def foo():
-                tags = {"a", "b"}
-                print(tags)
-        """)
-        tree = ast.parse(source)
-        diags = structure.STR004().check(tree, source)
+        source = """\
+def foo():
+    tags = {"a", "b"}
+    print(tags)
+"""
+        diags = _diags(_STR004, source)
         assert len(diags) == 1
         assert "tags" in diags[0].message
         assert "Set" in diags[0].message
@@ -1102,85 +1077,68 @@ class TestSTR004:
 
 
 def _check_str005(source: str) -> list[str]:
-    tree = ast.parse(textwrap.dedent(source))
-    return [diag.rule_id for diag in structure.STR005().check(tree, source)]
+    return [diag.rule_id for diag in _diags(_STR005, source)]
 
 
 class TestSTR005:
     # ------------------------------------------------------------------
-    # Not flagged
+    # Single-statement cases
     # ------------------------------------------------------------------
 
-    def test_final_annotation_ok(self) -> None:
-        assert _check_str005("MAX: Final = 100") == []
-
-    def test_final_subscript_ok(self) -> None:
-        assert _check_str005("MAX: Final[int] = 100") == []
-
-    def test_qualified_final_ok(self) -> None:
-        assert _check_str005("MAX: typing.Final = 100") == []
-
-    def test_qualified_final_subscript_ok(self) -> None:
-        assert _check_str005("MAX: typing.Final[int] = 100") == []
-
-    def test_lowercase_name_not_flagged(self) -> None:
-        assert _check_str005("max_size = 100") == []
-
-    def test_mixed_case_not_flagged(self) -> None:
-        assert _check_str005("MaxSize = 100") == []
-
-    def test_dunder_all_exempt(self) -> None:
-        assert _check_str005("__all__ = ['foo']") == []
-
-    def test_dunder_version_exempt(self) -> None:
-        assert _check_str005('__version__ = "1.0"') == []
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            pytest.param("MAX: Final = 100", [], id="final_annotation_ok"),
+            pytest.param("MAX: Final[int] = 100", [], id="final_subscript_ok"),
+            pytest.param("MAX: typing.Final = 100", [], id="qualified_final_ok"),
+            pytest.param(
+                "MAX: typing.Final[int] = 100", [], id="qualified_final_subscript_ok"
+            ),
+            pytest.param("max_size = 100", [], id="lowercase_name_not_flagged"),
+            pytest.param("MaxSize = 100", [], id="mixed_case_not_flagged"),
+            pytest.param("__all__ = ['foo']", [], id="dunder_all_exempt"),
+            pytest.param('__version__ = "1.0"', [], id="dunder_version_exempt"),
+            pytest.param("_MAX: Final = 100", [], id="private_constant_with_final_ok"),
+            pytest.param("MAX = 100", ["STR005"], id="plain_assign_flagged"),
+            pytest.param(
+                "MAX: int = 100", ["STR005"], id="annotated_non_final_flagged"
+            ),
+            pytest.param("_MAX = 100", ["STR005"], id="private_constant_flagged"),
+        ],
+    )
+    def test_check(self, source: str, expected: list[str]) -> None:
+        assert _check_str005(source) == expected
 
     def test_ann_assign_no_value_not_flagged(self) -> None:
         # Forward declaration with no assignment — nothing to enforce.
-        assert _check_str005("MAX: int") == []
+        assert not _check_str005("MAX: int")
 
     def test_inside_function_not_flagged(self) -> None:
         source = """\
-            def foo():
-                MAX = 100
-        """
-        assert _check_str005(source) == []
+def foo():
+    MAX = 100
+"""
+        assert not _check_str005(source)
 
     def test_inside_class_not_flagged(self) -> None:
         source = """\
-            class Foo:
-                MAX = 100
-        """
-        assert _check_str005(source) == []
+class Foo:
+    MAX = 100
+"""
+        assert not _check_str005(source)
 
     def test_inside_if_block_not_flagged(self) -> None:
         source = """\
-            if True:
-                MAX = 100
-        """
-        assert _check_str005(source) == []
-
-    def test_private_constant_with_final_ok(self) -> None:
-        assert _check_str005("_MAX: Final = 100") == []
-
-    # ------------------------------------------------------------------
-    # Flagged
-    # ------------------------------------------------------------------
-
-    def test_plain_assign_flagged(self) -> None:
-        assert _check_str005("MAX = 100") == ["STR005"]
-
-    def test_annotated_non_final_flagged(self) -> None:
-        assert _check_str005("MAX: int = 100") == ["STR005"]
-
-    def test_private_constant_flagged(self) -> None:
-        assert _check_str005("_MAX = 100") == ["STR005"]
+if True:
+    MAX = 100
+"""
+        assert not _check_str005(source)
 
     def test_two_constants_two_diagnostics(self) -> None:
         source = """\
-            A = 1
-            B = 2
-        """
+A = 1
+B = 2
+"""
         assert _check_str005(source) == ["STR005", "STR005"]
 
     def test_chained_assign_flags_each_name(self) -> None:
@@ -1189,9 +1147,9 @@ class TestSTR005:
 
     def test_good_and_bad_mixed(self) -> None:
         source = """\
-            A: Final = 1
-            B = 2
-        """
+A: Final = 1
+B = 2
+"""
         assert _check_str005(source) == ["STR005"]
 
     # ------------------------------------------------------------------
@@ -1200,30 +1158,26 @@ class TestSTR005:
 
     def test_rule_id(self) -> None:
         source = "MAX = 100"
-        tree = ast.parse(source)
-        diags = structure.STR005().check(tree, source)
+        diags = _diags(_STR005, source)
         assert diags[0].rule_id == "STR005"
 
     def test_diagnostic_points_to_assignment(self) -> None:
-        source = textwrap.dedent("""\
-            x = 1
-            MAX = 100
-        """)
-        tree = ast.parse(source)
-        diags = structure.STR005().check(tree, source)
+        source = """\
+x = 1
+MAX = 100
+"""
+        diags = _diags(_STR005, source)
         assert len(diags) == 1
         assert diags[0].line == 2
 
     def test_message_mentions_name(self) -> None:
         source = "MAX_SIZE = 100"
-        tree = ast.parse(source)
-        diags = structure.STR005().check(tree, source)
+        diags = _diags(_STR005, source)
         assert "`MAX_SIZE`" in diags[0].message
 
     def test_message_mentions_final(self) -> None:
         source = "MAX_SIZE = 100"
-        tree = ast.parse(source)
-        diags = structure.STR005().check(tree, source)
+        diags = _diags(_STR005, source)
         assert "Final" in diags[0].message
 
 
@@ -1233,72 +1187,65 @@ class TestSTR005:
 
 
 def _check_str006(source: str) -> list[str]:
-    tree = ast.parse(textwrap.dedent(source))
-    return [diag.rule_id for diag in structure.STR006().check(tree, source)]
+    return [diag.rule_id for diag in _diags(_STR006, source)]
 
 
 class TestSTR006:
     # ------------------------------------------------------------------
-    # Not flagged
+    # Single-statement cases
     # ------------------------------------------------------------------
 
-    def test_tuple_literal_ok(self) -> None:
-        assert _check_str006("ITEMS: Final = (1, 2, 3)") == []
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            pytest.param("ITEMS: Final = (1, 2, 3)", [], id="tuple_literal_ok"),
+            pytest.param("MAX = 100", [], id="int_literal_ok"),
+            pytest.param('NAME = "hello"', [], id="string_literal_ok"),
+            pytest.param("__all__ = ['foo']", [], id="dunder_exempt"),
+            pytest.param("ITEMS = [1, 2, 3]", ["STR006"], id="list_literal_flagged"),
+            pytest.param("TAGS = {1, 2, 3}", ["STR006"], id="set_literal_flagged"),
+            pytest.param(
+                "TAGS: Final = {1, 2, 3}",
+                ["STR006"],
+                id="set_with_final_still_flagged",
+            ),
+        ],
+    )
+    def test_check(self, source: str, expected: list[str]) -> None:
+        assert _check_str006(source) == expected
 
     def test_frozenset_call_ok(self) -> None:
         # frozenset() is a call, not a set literal — not flagged by this rule.
-        assert _check_str006('TAGS: Final = frozenset({"a", "b"})') == []
-
-    def test_int_literal_ok(self) -> None:
-        assert _check_str006("MAX = 100") == []
-
-    def test_string_literal_ok(self) -> None:
-        assert _check_str006('NAME = "hello"') == []
+        assert not _check_str006('TAGS: Final = frozenset({"a", "b"})')
 
     def test_lowercase_list_not_flagged(self) -> None:
         # Not a constant name — STR006 does not apply.
-        assert _check_str006("items = [1, 2, 3]") == []
-
-    def test_dunder_exempt(self) -> None:
-        assert _check_str006("__all__ = ['foo']") == []
+        assert not _check_str006("items = [1, 2, 3]")
 
     def test_list_inside_function_not_flagged(self) -> None:
         # STR004 handles function-scope mutable literals.
         source = """\
-            def foo():
-                ITEMS = [1, 2, 3]
-        """
-        assert _check_str006(source) == []
+def foo():
+    ITEMS = [1, 2, 3]
+"""
+        assert not _check_str006(source)
 
     def test_list_inside_class_not_flagged(self) -> None:
         source = """\
-            class Foo:
-                ITEMS = [1, 2, 3]
-        """
-        assert _check_str006(source) == []
-
-    # ------------------------------------------------------------------
-    # Flagged
-    # ------------------------------------------------------------------
-
-    def test_list_literal_flagged(self) -> None:
-        assert _check_str006("ITEMS = [1, 2, 3]") == ["STR006"]
-
-    def test_set_literal_flagged(self) -> None:
-        assert _check_str006("TAGS = {1, 2, 3}") == ["STR006"]
+class Foo:
+    ITEMS = [1, 2, 3]
+"""
+        assert not _check_str006(source)
 
     def test_list_with_final_still_flagged(self) -> None:
         # Final prevents reassignment but not in-place mutation.
         assert _check_str006("ITEMS: Final = [1, 2, 3]") == ["STR006"]
 
-    def test_set_with_final_still_flagged(self) -> None:
-        assert _check_str006("TAGS: Final = {1, 2, 3}") == ["STR006"]
-
     def test_two_mutable_constants_two_diagnostics(self) -> None:
         source = """\
-            A = [1]
-            B = {2}
-        """
+A = [1]
+B = {2}
+"""
         assert _check_str006(source) == ["STR006", "STR006"]
 
     # ------------------------------------------------------------------
@@ -1307,37 +1254,32 @@ class TestSTR006:
 
     def test_rule_id(self) -> None:
         source = "ITEMS = [1, 2, 3]"
-        tree = ast.parse(source)
-        diags = structure.STR006().check(tree, source)
+        diags = _diags(_STR006, source)
         assert diags[0].rule_id == "STR006"
 
     def test_diagnostic_points_to_literal(self) -> None:
-        source = textwrap.dedent("""\
-            x = 1
-            ITEMS = [1, 2, 3]
-        """)
-        tree = ast.parse(source)
-        diags = structure.STR006().check(tree, source)
+        source = """\
+x = 1
+ITEMS = [1, 2, 3]
+"""
+        diags = _diags(_STR006, source)
         assert len(diags) == 1
         assert diags[0].line == 2
 
     def test_message_mentions_name(self) -> None:
         source = "ITEMS = [1, 2, 3]"
-        tree = ast.parse(source)
-        diags = structure.STR006().check(tree, source)
+        diags = _diags(_STR006, source)
         assert "`ITEMS`" in diags[0].message
 
     def test_message_mentions_list_and_tuple(self) -> None:
         source = "ITEMS = [1, 2, 3]"
-        tree = ast.parse(source)
-        diags = structure.STR006().check(tree, source)
+        diags = _diags(_STR006, source)
         assert "list" in diags[0].message
         assert "tuple" in diags[0].message
 
     def test_message_mentions_set_and_frozenset(self) -> None:
         source = "TAGS = {1, 2, 3}"
-        tree = ast.parse(source)
-        diags = structure.STR006().check(tree, source)
+        diags = _diags(_STR006, source)
         assert "set" in diags[0].message
         assert "frozenset" in diags[0].message
         assert "frozenset" in diags[0].message
@@ -1347,49 +1289,46 @@ class TestSTR006:
 
 
 def _check_str007(source: str) -> list[str]:
-    tree = ast.parse(textwrap.dedent(source))
-    return [diag.rule_id for diag in structure.STR007().check(tree, source)]
+    return [diag.rule_id for diag in _diags(_STR007, source)]
 
 
 class TestSTR007:
-    def test_typed_final_ok(self) -> None:
-        assert _check_str007("MAX: Final[int] = 100") == []
-
-    def test_typed_final_str_ok(self) -> None:
-        assert _check_str007('LABEL: Final[str] = "hello"') == []
-
-    def test_typing_final_typed_ok(self) -> None:
-        assert _check_str007("MAX: typing.Final[int] = 100") == []
-
-    def test_bare_final_flagged(self) -> None:
-        assert _check_str007("MAX: Final = 100") == ["STR007"]
-
-    def test_bare_typing_final_flagged(self) -> None:
-        assert _check_str007("MAX: typing.Final = 100") == ["STR007"]
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            pytest.param("MAX: Final[int] = 100", [], id="typed_final_ok"),
+            pytest.param('LABEL: Final[str] = "hello"', [], id="typed_final_str_ok"),
+            pytest.param(
+                "MAX: typing.Final[int] = 100", [], id="typing_final_typed_ok"
+            ),
+            pytest.param("MAX: int = 100", [], id="non_final_annotation_not_flagged"),
+            pytest.param("MAX: Final = 100", ["STR007"], id="bare_final_flagged"),
+            pytest.param(
+                "MAX: typing.Final = 100", ["STR007"], id="bare_typing_final_flagged"
+            ),
+        ],
+    )
+    def test_check(self, source: str, expected: list[str]) -> None:
+        assert _check_str007(source) == expected
 
     def test_multiple_bare_finals_flagged(self) -> None:
         source = """\
-            MAX: Final = 100
-            MIN: Final = 0
-        """
+MAX: Final = 100
+MIN: Final = 0
+"""
         assert _check_str007(source) == ["STR007", "STR007"]
 
     def test_plain_assignment_not_flagged(self) -> None:
         # STR007 only checks annotated assignments; plain assignments are STR005's.
-        assert _check_str007("MAX = 100") == []
-
-    def test_non_final_annotation_not_flagged(self) -> None:
-        assert _check_str007("MAX: int = 100") == []
+        assert not _check_str007("MAX = 100")
 
     def test_message_mentions_constant_name(self) -> None:
         source = "TIMEOUT: Final = 30"
-        tree = ast.parse(source)
-        diags = structure.STR007().check(tree, source)
+        diags = _diags(_STR007, source)
         assert diags[0].rule_id == "STR007"
         assert "TIMEOUT" in diags[0].message
 
     def test_message_mentions_final_type(self) -> None:
         source = "TIMEOUT: Final = 30"
-        tree = ast.parse(source)
-        diags = structure.STR007().check(tree, source)
+        diags = _diags(_STR007, source)
         assert "Final[" in diags[0].message
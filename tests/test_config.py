@@ -1,6 +1,8 @@
 """Tests for sergey.config: load_config and filter_rules."""
 
+import ast
 import pathlib
+from collections.abc import Sequence
 
 from sergey import analyzer as sergey_analyzer
 from sergey import config as sergey_config
@@ -10,13 +12,25 @@ from sergey.rules import imports, naming, pydantic, structure
 # Helpers
 # ---------------------------------------------------------------------------
 
-_SAMPLE_RULES = [imports.IMP002(), imports.IMP003(), pydantic.PDT001()]
+# The rules keep no per-check state, and configure() returns a new instance
+# rather than mutating, so shared module-level instances are safe.
+_IMP002 = imports.IMP002()
+_NAM002 = naming.NAM002()
+_STR003 = structure.STR003()
 
+_SAMPLE_RULES = (imports.IMP002(), imports.IMP003(), pydantic.PDT001())
 
-def _ids(rule_list: list) -> list[str]:
+# Config is frozen, so the no-constraint default can be shared across tests.
+_DEFAULT_CONFIG = sergey_config.Config(select=None, ignore=frozenset())
+
+
+def _ids(rule_list: Sequence) -> list[str]:
     return [type(rule).__name__ for rule in rule_list]
 
 
+_SAMPLE_IDS = _ids(_SAMPLE_RULES)
+
+
 # ---------------------------------------------------------------------------
 # load_config — no pyproject.toml
 # ---------------------------------------------------------------------------
@@ -117,10 +131,8 @@ class TestLoadConfigIgnore:
 
 class TestFilterRules:
     def test_no_select_no_ignore_returns_all(self) -> None:
-        cfg = sergey_config.Config(select=None, ignore=frozenset())
-        assert _ids(sergey_config.filter_rules(_SAMPLE_RULES, cfg)) == _ids(
-            _SAMPLE_RULES
-        )
+        cfg = _DEFAULT_CONFIG
+        assert _ids(sergey_config.filter_rules(_SAMPLE_RULES, cfg)) == _SAMPLE_IDS
 
     def test_select_restricts_to_listed_rules(self) -> None:
         cfg = sergey_config.Config(select=frozenset({"IMP002"}), ignore=frozenset())
@@ -165,7 +177,7 @@ class TestFilterRules:
         assert result == ["IMP002", "PDT001"]
 
     def test_empty_rules_list(self) -> None:
-        cfg = sergey_config.Config(select=None, ignore=frozenset())
+        cfg = _DEFAULT_CONFIG
         assert sergey_config.filter_rules([], cfg) == []
 
 
@@ -177,14 +189,14 @@ class TestFilterRules:
 class TestFilterIntegration:
     def test_ignored_rule_produces_no_diagnostic(self) -> None:
         cfg = sergey_config.Config(select=None, ignore=frozenset({"NAM002"}))
-        active = sergey_config.filter_rules([naming.NAM002()], cfg)
+        active = sergey_config.filter_rules([_NAM002], cfg)
         az = sergey_analyzer.Analyzer(rules=active)
         # NAM002 would normally flag `x` as non-descriptive
         assert az.analyze("x = 1") == []
 
     def test_selected_rule_still_fires(self) -> None:
         cfg = sergey_config.Config(select=frozenset({"NAM002"}), ignore=frozenset())
-        active = sergey_config.filter_rules([naming.NAM002(), imports.IMP002()], cfg)
+        active = sergey_config.filter_rules([_NAM002, _IMP002], cfg)
         az = sergey_analyzer.Analyzer(rules=active)
         diag_ids = [diag.rule_id for diag in az.analyze("x = 1")]
         assert diag_ids == ["NAM002"]
@@ -233,8 +245,8 @@ class TestLoadConfigRuleOptions:
 
 class TestConfigureRules:
     def test_no_options_returns_same_rules(self) -> None:
-        cfg = sergey_config.Config(select=None, ignore=frozenset())
-        rules = [structure.STR003()]
+        cfg = _DEFAULT_CONFIG
+        rules = [_STR003]
         result = sergey_config.configure_rules(rules, cfg)
         assert result == rules
 
@@ -244,13 +256,11 @@ class TestConfigureRules:
             ignore=frozenset(),
             rule_options={"STR003": {"max_body_stmts": 2}},
         )
-        original = structure.STR003()
+        original = _STR003
         result = sergey_config.configure_rules([original], cfg)
         assert len(result) == 1
         # The configured rule uses the new threshold
         source = "try:\n    a=1\n    b=2\n    c=3\nexcept Exception:\n    pass\n"
-        import ast  # noqa: PLC0415
-
         tree = ast.parse(source)
         assert len(result[0].check(tree, source)) == 1
         assert len(original.check(tree, source)) == 0
@@ -261,10 +271,9 @@ class TestConfigureRules:
             ignore=frozenset(),
             rule_options={"STR003": {"max_body_stmts": 2}},
         )
-        imp_rule = imports.IMP002()
-        result = sergey_config.configure_rules([imp_rule], cfg)
-        assert result == [imp_rule]
+        result = sergey_config.configure_rules([_IMP002], cfg)
+        assert result == [_IMP002]
 
     def test_empty_rules_list(self) -> None:
-        cfg = sergey_config.Config(select=None, ignore=frozenset())
+        cfg = _DEFAULT_CONFIG
         assert sergey_config.configure_rules([], cfg) == []
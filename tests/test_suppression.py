@@ -1,7 +1,5 @@
 """Tests for inline suppression: # sergey: noqa and # sergey: disable-file."""
 
-import textwrap
-
 from sergey import analyzer
 from sergey.rules import imports, naming
 
@@ -36,10 +34,10 @@ class TestLineSuppression:
         assert result == ["IMP002"]
 
     def test_noqa_only_affects_its_own_line(self) -> None:
-        source = textwrap.dedent("""\
-            import typing
-            import os  # sergey: noqa
-        """)
+        source = """\
+import typing
+import os  # sergey: noqa
+"""
         # the suppression on line 2 has no effect on IMP002 on line 1
         assert _imp_ids(source) == ["IMP002"]
 
@@ -64,10 +62,10 @@ class TestLineSuppression:
         assert result == ["NAM002"]
 
     def test_noqa_on_comment_only_line_does_not_affect_other_lines(self) -> None:
-        source = textwrap.dedent("""\
-            import typing
-            # sergey: noqa
-        """)
+        source = """\
+import typing
+# sergey: noqa
+"""
         # The noqa comment is on line 2; the diagnostic is on line 1.
         assert _imp_ids(source) == ["IMP002"]
 
@@ -79,60 +77,60 @@ class TestLineSuppression:
 
 class TestFileSuppression:
     def test_disable_file_bare_suppresses_all(self) -> None:
-        source = textwrap.dedent("""\
-            # sergey: disable-file
-            import typing
-            import os.path
-        """)
+        source = """\
+# sergey: disable-file
+import typing
+import os.path
+"""
         assert _imp_ids(source) == []
 
     def test_disable_file_specific_rule_suppresses_only_that_rule(self) -> None:
-        source = textwrap.dedent("""\
-            # sergey: disable-file: IMP002
-            import typing
-            import os.path
-        """)
+        source = """\
+# sergey: disable-file: IMP002
+import typing
+import os.path
+"""
         result = _imp_ids(source)
         assert result == ["IMP003"]
 
     def test_disable_file_does_not_suppress_other_rules(self) -> None:
-        source = textwrap.dedent("""\
-            # sergey: disable-file: IMP003
-            import typing
-        """)
+        source = """\
+# sergey: disable-file: IMP003
+import typing
+"""
         result = _imp_ids(source)
         assert result == ["IMP002"]
 
     def test_disable_file_applies_regardless_of_position(self) -> None:
         # disable-file at the bottom still covers lines above it
-        source = textwrap.dedent("""\
-            import typing
-            import os.path
-            # sergey: disable-file
-        """)
+        source = """\
+import typing
+import os.path
+# sergey: disable-file
+"""
         assert _imp_ids(source) == []
 
     def test_disable_file_multiple_rules_comma_separated(self) -> None:
-        source = textwrap.dedent("""\
-            # sergey: disable-file: IMP002, IMP003
-            import typing
-            import os.path
-        """)
+        source = """\
+# sergey: disable-file: IMP002, IMP003
+import typing
+import os.path
+"""
         assert _imp_ids(source) == []
 
     def test_disable_file_case_insensitive_rule_id(self) -> None:
-        source = textwrap.dedent("""\
-            # sergey: disable-file: imp002
-            import typing
-        """)
+        source = """\
+# sergey: disable-file: imp002
+import typing
+"""
         assert _imp_ids(source) == []
 
     def test_disable_file_works_for_nam002(self) -> None:
-        source = textwrap.dedent("""\
-            # sergey: disable-file: NAM002
-            x = 1
-            y = 2
-        """)
+        source = """\
+# sergey: disable-file: NAM002
+x = 1
+y = 2
+"""
         assert _nam_ids(source) == []
 
 
@@ -143,27 +141,27 @@ class TestFileSuppression:
 
 class TestCombinedSuppression:
     def test_file_and_line_together_suppress_different_rules(self) -> None:
-        source = textwrap.dedent("""\
-            # sergey: disable-file: IMP002
-            import typing
-            import os.path  # sergey: noqa: IMP003
-        """)
+        source = """\
+# sergey: disable-file: IMP002
+import typing
+import os.path  # sergey: noqa: IMP003
+"""
         # IMP002 suppressed by file directive, IMP003 suppressed on its line
         assert _imp_ids(source) == []
 
     def test_line_suppression_fills_gap_left_by_file_suppression(self) -> None:
-        source = textwrap.dedent("""\
-            # sergey: disable-file: IMP002
-            import typing
-            import os.path
-        """)
+        source = """\
+# sergey: disable-file: IMP002
+import typing
+import os.path
+"""
         # IMP002 file-disabled; IMP003 on line 3 is NOT suppressed
         result = _imp_ids(source)
         assert result == ["IMP003"]
 
     def test_file_suppression_and_redundant_line_noqa(self) -> None:
-        source = textwrap.dedent("""\
-            # sergey: disable-file
-            import typing  # sergey: noqa: IMP002
-        """)
+        source = """\
+# sergey: disable-file
+import typing  # sergey: noqa: IMP002
+"""
         assert _imp_ids(source) == []